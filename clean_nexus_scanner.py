@@ -10,14 +10,47 @@ import json
 import csv
 import glob
 import shutil
+import re
 import logging
 import subprocess
-from datetime import datetime
-from typing import List, Dict, Any, Optional
-from collections import Counter
+import queue
+import threading
+import itertools
+import hashlib
+import html
+import time
+import socket
+import secrets
+import atexit
+import urllib.request
+import tempfile
+import gzip
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional, Iterator
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
+try:
+    import orjson  # Optional C-accelerated JSON encoder for the large comprehensive report
+except ImportError:
+    orjson = None
 from config_loader import get_config
+import report_templates
+from report_templates import (
+    SCAN_REPORT_HEADER, SCAN_REPORT_NO_VULNERABILITIES, SCAN_REPORT_VULNERABILITY,
+    SCAN_REPORT_VULNERABILITY_DEFAULTS, COMPREHENSIVE_REPORT_HEADER, COMPREHENSIVE_DETAILS_TABLE_HEADER,
+    COMPREHENSIVE_VULNERABILITY_ROW, COMPREHENSIVE_VULNERABILITY_ROW_DEFAULTS, COMPREHENSIVE_VULNERABILITY_ROW_FIELDS,
+    SEVERITY_BADGE_COLORS, SEVERITY_ROW_BACKGROUNDS, COMPREHENSIVE_DETAILS_TABLE_FOOTER, COMPREHENSIVE_CLEAN_STATUS,
+    REPORT_FOOTER, REPORT_STYLESHEETS, SCAN_REPORT_EMPTY_BODY, COMPREHENSIVE_EMPTY_BODY,
+    SEVERITY_CHART_ORDER, SEVERITY_CHART_INFO, SEVERITY_CSS_CLASSES, SCAN_REPORT_SEVERITY_CLASSES,
+    SCAN_REPORT_REPEATED_VULNERABILITY, SCAN_REPORT_ASSET_ITEM, SCAN_REPORT_REPOSITORY_HEADER,
+    SCAN_REPORT_COMPONENT_HEADER, COMPREHENSIVE_SEVERITY_ITEM, COMPREHENSIVE_REPOSITORY_CARD_HEADER,
+    COMPREHENSIVE_REPOSITORY_CARD_FOOTER, COMPREHENSIVE_COMPONENT_ITEM,
+)
 
 # Configure logging without Unicode
 logging.basicConfig(
@@ -51,6 +84,9 @@ class CleanNexusScanner:
         
         # Performance configuration
         self.skip_pre_scan_component_count = config.get('skip_pre_scan_component_count', False)
+        self.trivy_server_mode = config.get('trivy_server_mode', True)
+        self.scan_temp_dir = config.get('scan_temp_dir', '').strip()
+        self.compress_reports = config.get('compress_reports', False)
         
         # Date-based artifact filtering
         scan_artifacts_from_date_str = config.get('scan_artifacts_from_date', '').strip()
@@ -79,7 +115,32 @@ class CleanNexusScanner:
         
         # Setup authentication
         self.auth = HTTPBasicAuth(self.username, self.password)
-        
+
+        # Shared HTTP session so all Nexus calls reuse pooled keep-alive connections
+        self.session = requests.Session()
+        self.session.auth = self.auth
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # Number of repositories whose component listings are fetched at once
+        self.component_fetch_workers = 16
+        
+        # Number of asset downloads allowed to run ahead of the assets currently being scanned
+        self.download_prefetch = 2
+        
+        self._asset_dir_counter = itertools.count()
+        
+        # Write buffer for the consolidated reports, which are streamed fragment by fragment
+        self.report_write_buffer = 1024 * 1024
+        
+        # Rendered comprehensive report body from the previous run, reused when findings are unchanged
+        self.report_cache_file = os.path.join(self.output_dir, '.report-cache', 'comprehensive_body.html')
+
         # Setup logging with debug configuration
         if self.debug_log_file:
             # Ensure output directory exists before creating log file
@@ -168,14 +229,42 @@ class CleanNexusScanner:
         # Create output directory
         os.makedirs(self.output_dir, exist_ok=True)
         
-        # Create temp directory for downloads
-        self.temp_dir = os.path.join(self.output_dir, 'temp')
-        os.makedirs(self.temp_dir, exist_ok=True)
+        # Create temp directory for downloads; SCAN_TEMP_DIR (e.g. /dev/shm) moves it onto a RAM-backed
+        # filesystem, using a private subdirectory so the final cleanup never touches anything else there
+        if self.scan_temp_dir:
+            self.temp_dir = tempfile.mkdtemp(prefix='nexus_scan_', dir=self.scan_temp_dir)
+            # Staged downloads in a RAM-backed directory hold memory until removed, so also clean up on abnormal exits
+            atexit.register(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        else:
+            self.temp_dir = os.path.join(self.output_dir, 'temp')
+            os.makedirs(self.temp_dir, exist_ok=True)
+        
+        # Download the vulnerability DBs once so individual scans skip the update check
+        self.trivy_cache_dir = os.path.join(self.output_dir, '.trivy-cache')
+        self.trivy_db_args = self.prepare_trivy_cache()
+        
+        # One local Trivy server keeps the vulnerability DB loaded; concurrent scans run as its clients
+        self.trivy_server = None
+        self.trivy_server_args = self.start_trivy_server()
+        
+        # Number of Trivy scans run at once; results are still recorded in asset order on the main thread.
+        # Standalone scans all lock the shared cache DB, so without a server they would only queue on each other.
+        self.scan_workers = 4 if self.trivy_server_args else 1
+        
+        # HTML reports are rendered from each scan's JSON with trivy convert when this Trivy release has it
+        self.trivy_convert_supported = self.detect_trivy_convert()
+        
+        # Background janitor thread removes scanned files off the scan critical path
+        self.cleanup_queue = queue.Queue()
+        self._cleanup_counter = itertools.count()
+        cleanup_thread = threading.Thread(target=self._cleanup_worker, name='cleanup-janitor', daemon=True)
+        cleanup_thread.start()
         
         # Log disk space management info
         self.logger.info("📁 DISK SPACE MANAGEMENT:")
-        self.logger.info(f"   • Downloads are processed ONE AT A TIME to minimize disk usage")
-        self.logger.info(f"   • Files are deleted immediately after scanning")
+        self.logger.info(f"   • Downloads run at most {self.download_prefetch} assets ahead of the scan to bound disk usage")
+        self.logger.info(f"   • Up to {self.scan_workers} assets are scanned concurrently")
+        self.logger.info(f"   • Files are deleted by a background janitor right after scanning")
         self.logger.info(f"   • Extracted archives are cleaned up automatically")
         self.logger.info(f"   • Temp directory: {self.temp_dir}")
         
@@ -185,9 +274,17 @@ class CleanNexusScanner:
             'components_found': 0,
             'assets_scanned': 0,
             'vulnerabilities_found': 0,
-            'scan_errors': 0
+            'scan_errors': 0,
+            'assets_deduplicated': 0
         }
         
+        # Scan results keyed by Nexus asset checksum, reused for identical content in other repositories
+        self.checksum_scan_cache = {}
+        
+        # The same results persist across runs for as long as the Trivy DBs they were produced with
+        self.trivy_db_version = self.get_trivy_db_version()
+        self.scan_cache_dir = self.prepare_scan_cache_dir()
+        
         # Report organization statistics
         self.report_stats = {
             'reports_with_vulnerabilities': 0,
@@ -195,6 +292,14 @@ class CleanNexusScanner:
             'total_reports_saved': 0
         }
         
+        # Individual report files are written on a small I/O pool so the scan loop never waits on disk
+        self.report_write_pool = ThreadPoolExecutor(max_workers=min(16, (os.cpu_count() or 1) * 2),
+                                                    thread_name_prefix='report-writer')
+        self.report_writes = {}
+        
+        # One shared copy of each advisory's text; the same CVE is reported again for every affected asset
+        self.advisory_texts = {}
+        
         # Intelligent detection statistics using Counter for easy incrementation
         self.statistics = {
             'repository_types': Counter(),
@@ -223,6 +328,62 @@ class CleanNexusScanner:
             'sbom': ['.json', '.xml', '.spdx'],
             'security_report': ['trivy-report', 'scan-report', '.sarif']
         }
+
+        # Archive types Trivy scans natively without extraction
+        self.native_archive_suffixes = ('.jar', '.war', '.ear')
+        
+        # External decompression tools for faster .tar.gz/.tgz extraction (optional)
+        self.tar_path = shutil.which('tar')
+        self.pigz_path = shutil.which('pigz')
+
+        # Single-pass filename sanitizing: path separators and Windows-invalid characters -> '_'
+        self.safe_filename_table = str.maketrans({char: '_' for char in '/\\:?*<>|"'})
+        
+        # Repository formats whose content Trivy has no analyzer for (skipped unless requested by name)
+        self.unscannable_repository_formats = frozenset({'gitlfs', 'bower', 'r'})
+        
+        # Checksum/signature and repository metadata files skipped before download (nothing for Trivy to scan).
+        # Maven repositories carry several of these per artifact, so they never reach detection or HTTP.
+        self.skip_asset_suffixes = ('.md5', '.sha1', '.sha256', '.sha512', '.asc', '.sig',
+                                    'maven-metadata.xml', '.module', '.lastupdated')
+
+        # Priority-ordered detection rules used by detect_artifact_type (earlier rules win).
+        # Each rule: (artifact_type, suffixes, substrings, required_keywords)
+        # required_keywords restricts a suffix match to names containing one of the keywords.
+        self.artifact_detection_rules = [
+            ('script', ['.md5', '.sha1', '.sha256', '.sha512'], [], []),  # Hash/checksum files
+            ('java_jar', ['.jar', '.war', '.ear'], [], []),
+            ('java_source', ['.java', '.class'], [], []),
+            ('maven_pom', ['.pom'], ['pom.xml'], []),
+            ('python_package', ['.whl', '.egg'], [], []),
+            ('python_package', ['.tar.gz'], [], ['python']),
+            ('nuget_package', ['.nupkg', '.nuspec'], [], []),
+            ('node_package', ['.tgz'], [], ['node', 'client', 'npm']),
+            ('node_package', ['.npm', '.tar.gz'], ['package.json'], []),
+            ('docker_manifest', [], ['manifest.json', 'config.json'], []),
+            ('archive', ['.zip', '.7z', '.rar', '.tar', '.tgz'], [], []),
+            ('binary_executable', ['.exe', '.dll', '.so', '.dylib'], [], []),
+            ('script', ['.sh', '.bat', '.ps1', '.py', '.js'], [], []),
+            ('configuration', ['.xml', '.json', '.yaml', '.yml', '.properties', '.conf'], [], []),
+            ('sbom', [], ['.spdx'], []),
+            ('security_report', [], ['trivy-report', 'scan-report', '.sarif'], [])
+        ]
+        self._compile_artifact_detection()
+
+    def _compile_artifact_detection(self):
+        """Precompute suffix lookup table and substring regex from artifact_detection_rules."""
+        self._suffix_map = {}
+        self._substring_ranks = {}
+
+        for rank, (artifact_type, suffixes, substrings, keywords) in enumerate(self.artifact_detection_rules):
+            for suffix in suffixes:
+                self._suffix_map.setdefault(suffix, []).append((rank, artifact_type, tuple(keywords)))
+            for substring in substrings:
+                self._substring_ranks.setdefault(substring, (rank, artifact_type))
+
+        # Compound suffixes (e.g. '.tar.gz') must be checked in addition to the last extension
+        self._compound_suffixes = tuple(suffix for suffix in self._suffix_map if suffix.count('.') > 1)
+        self._substring_re = re.compile('|'.join(re.escape(s) for s in self._substring_ranks))
     
     def log_scan_issue(self, issue_type: str, asset_info: dict, reason: str, details: str = ""):
         """Log scan issues (errors, skips, warnings) to tracking system."""
@@ -280,15 +441,15 @@ class CleanNexusScanner:
         if self.debug_mode:
             self.logger.debug(f"Successful scan logged: {scan_record}")
     
-    def save_scan_issues_report(self, scan_timestamp: str):
+    def save_scan_issues_report(self, scan_timestamp: str, file_stamp: str):
         """Save scan issues to separate report files with repository-wise organization."""
         try:
             # Create timestamped folder
-            timestamped_folder = os.path.join(self.output_dir, f"scan_reports_{scan_timestamp.replace(':', '-')}")
+            timestamped_folder = os.path.join(self.output_dir, f"scan_reports_{file_stamp}")
             os.makedirs(timestamped_folder, exist_ok=True)
             
             # Create issues report filename
-            issues_filename = f"scan_issues_report_{scan_timestamp.replace(':', '-')}.json"
+            issues_filename = f"scan_issues_report_{file_stamp}.json"
             issues_filepath = os.path.join(timestamped_folder, issues_filename)
             
             # Prepare comprehensive issues report
@@ -317,17 +478,16 @@ class CleanNexusScanner:
             self.logger.info(f"Scan issues report saved: {issues_filepath}")
             
             # Save CSV reports with repository-wise details
-            self._save_csv_reports(timestamped_folder, scan_timestamp)
+            self._save_csv_reports(timestamped_folder, file_stamp)
             
         except Exception as e:
             self.logger.error(f"Error saving scan issues report: {e}")
     
-    def _save_csv_reports(self, output_folder: str, scan_timestamp: str):
+    def _save_csv_reports(self, output_folder: str, file_stamp: str):
         """Save separate CSV reports for errors, skips, warnings, and successful scans."""
-        
         # CSV report for scan errors
         if self.scan_issues['errors']:
-            errors_csv = os.path.join(output_folder, f"scan_errors_{scan_timestamp.replace(':', '-')}.csv")
+            errors_csv = os.path.join(output_folder, f"scan_errors_{file_stamp}.csv")
             with open(errors_csv, 'w', newline='', encoding='utf-8') as csvfile:
                 fieldnames = ['timestamp', 'repository', 'component', 'asset', 'artifact_type', 'reason', 'details']
                 writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
@@ -338,7 +498,7 @@ class CleanNexusScanner:
         
         # CSV report for skipped files  
         if self.scan_issues['skipped_files']:
-            skipped_csv = os.path.join(output_folder, f"scan_skipped_{scan_timestamp.replace(':', '-')}.csv")
+            skipped_csv = os.path.join(output_folder, f"scan_skipped_{file_stamp}.csv")
             with open(skipped_csv, 'w', newline='', encoding='utf-8') as csvfile:
                 fieldnames = ['timestamp', 'repository', 'component', 'asset', 'artifact_type', 'reason', 'details']
                 writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
@@ -349,7 +509,7 @@ class CleanNexusScanner:
         
         # CSV report for successful scans
         if self.scan_issues['successful_scans']:
-            success_csv = os.path.join(output_folder, f"scan_successful_{scan_timestamp.replace(':', '-')}.csv")
+            success_csv = os.path.join(output_folder, f"scan_successful_{file_stamp}.csv")
             with open(success_csv, 'w', newline='', encoding='utf-8') as csvfile:
                 fieldnames = ['timestamp', 'repository', 'component', 'asset', 'artifact_type', 'scan_strategy', 
                              'vulnerabilities_found', 'scan_type', 'file_size', 'scan_duration', 'trivy_command']
@@ -361,7 +521,7 @@ class CleanNexusScanner:
         
         # CSV report for warnings
         if self.scan_issues['warnings']:
-            warnings_csv = os.path.join(output_folder, f"scan_warnings_{scan_timestamp.replace(':', '-')}.csv")
+            warnings_csv = os.path.join(output_folder, f"scan_warnings_{file_stamp}.csv")
             with open(warnings_csv, 'w', newline='', encoding='utf-8') as csvfile:
                 fieldnames = ['timestamp', 'repository', 'component', 'asset', 'artifact_type', 'reason', 'details']
                 writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
@@ -373,11 +533,7 @@ class CleanNexusScanner:
     
     def _group_issues_by_reason(self, issues_list: list) -> dict:
         """Group issues by reason for summary statistics."""
-        reason_counts = {}
-        for issue in issues_list:
-            reason = issue.get('reason', 'Unknown')
-            reason_counts[reason] = reason_counts.get(reason, 0) + 1
-        return reason_counts
+        return dict(Counter(issue.get('reason', 'Unknown') for issue in issues_list))
     
     def _group_successful_scans_by_type(self, successful_scans_list: list) -> dict:
         """Group successful scans by artifact type for summary statistics."""
@@ -399,9 +555,8 @@ class CleanNexusScanner:
     def test_connection(self) -> bool:
         """Test connection to Nexus server."""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.nexus_url}/service/rest/v1/status",
-                auth=self.auth,
                 timeout=30
             )
             if response.status_code == 200:
@@ -417,9 +572,8 @@ class CleanNexusScanner:
     def get_repositories(self) -> List[Dict[str, Any]]:
         """Get all repositories from Nexus, optionally filtered by repository names."""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.nexus_url}/service/rest/v1/repositories",
-                auth=self.auth,
                 timeout=30
             )
             response.raise_for_status()
@@ -454,12 +608,7 @@ class CleanNexusScanner:
                 self.logger.info(f"Scanning repositories: {found_repos}")
                 
                 # Log repository types being scanned
-                repo_types = {}
-                for repo in filtered_repos:
-                    repo_type = repo.get('type')
-                    repo_format = repo.get('format')
-                    key = f"{repo_format}-{repo_type}"
-                    repo_types[key] = repo_types.get(key, 0) + 1
+                repo_types = Counter(f"{repo.get('format')}-{repo.get('type')}" for repo in filtered_repos)
                 
                 if repo_types:
                     self.logger.info(f"Repository types to scan: {dict(repo_types)}")
@@ -470,11 +619,14 @@ class CleanNexusScanner:
                 hosted_repos = [repo for repo in all_repos if repo.get('type') == 'hosted']
                 self.logger.info("Repository filtering disabled: scanning all hosted repositories")
                 
+                # Formats Trivy has no analyzer for are dropped before their components are ever paged through
+                skipped_repos = [repo.get('name') for repo in hosted_repos if repo.get('format') in self.unscannable_repository_formats]
+                if skipped_repos:
+                    self.logger.info(f"Skipping {len(skipped_repos)} hosted repositories in formats Trivy cannot scan: {skipped_repos}")
+                    hosted_repos = [repo for repo in hosted_repos if repo.get('format') not in self.unscannable_repository_formats]
+                
                 # Log repository types found
-                repo_types = {}
-                for repo in hosted_repos:
-                    format_type = repo.get('format', 'unknown')
-                    repo_types[format_type] = repo_types.get(format_type, 0) + 1
+                repo_types = Counter(repo.get('format', 'unknown') for repo in hosted_repos)
                 
                 self.logger.info(f"Found {len(hosted_repos)} hosted repositories: {dict(repo_types)}")
                 return hosted_repos
@@ -785,7 +937,7 @@ class CleanNexusScanner:
                 if self.debug_http_requests:
                     self.logger.debug(f"HTTP GET: {url} with params: {params}")
                 
-                response = requests.get(url, auth=self.auth, params=params, timeout=30)
+                response = self.session.get(url, params=params, timeout=30)
                 
                 if self.debug_http_requests:
                     self.logger.debug(f"Response status: {response.status_code}")
@@ -829,20 +981,24 @@ class CleanNexusScanner:
             self.logger.debug(f"Asset URL: {asset_url}")
             self.logger.debug(f"Local path: {local_path}")
             
-            response = requests.get(asset_url, auth=self.auth, stream=True, timeout=60)
-            self.logger.debug(f"HTTP status code: {response.status_code}")
-            self.logger.debug(f"Content-Type: {response.headers.get('Content-Type', 'Unknown')}")
-            self.logger.debug(f"Content-Length: {response.headers.get('Content-Length', 'Unknown')}")
-            
-            response.raise_for_status()
-            
-            os.makedirs(os.path.dirname(local_path), exist_ok=True)
-            
-            downloaded_size = 0
-            with open(local_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-                    downloaded_size += len(chunk)
+            # Context manager releases the pooled connection even if the download fails
+            with self.session.get(asset_url, stream=True, timeout=60) as response:
+                self.logger.debug(f"HTTP status code: {response.status_code}")
+                self.logger.debug(f"Content-Type: {response.headers.get('Content-Type', 'Unknown')}")
+                self.logger.debug(f"Content-Length: {response.headers.get('Content-Length', 'Unknown')}")
+
+                response.raise_for_status()
+
+                os.makedirs(os.path.dirname(local_path), exist_ok=True)
+
+                # Download under a .part name and rename when complete, so a partial file is never scanned
+                partial_path = f"{local_path}.part"
+                downloaded_size = 0
+                with open(partial_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=1 << 16):
+                        f.write(chunk)
+                        downloaded_size += len(chunk)
+                os.replace(partial_path, local_path)
             
             self.logger.debug(f"Downloaded {downloaded_size} bytes")
             self.logger.debug(f"File exists after download: {os.path.exists(local_path)}")
@@ -858,6 +1014,172 @@ class CleanNexusScanner:
             self.logger.debug(f"Download exception details: ", exc_info=True)
             return False
     
+    def get_checksum_cache_key(self, asset: Dict[str, Any], strategy: dict) -> Optional[tuple]:
+        """Build the checksum cache key for an asset, or None if Nexus provided no checksum."""
+        checksum = asset.get('checksum') or {}
+        for algorithm in ('sha256', 'sha1'):
+            if checksum.get(algorithm):
+                # Identical bytes may still be scanned differently depending on the strategy
+                return (f"{algorithm}:{checksum[algorithm]}", strategy['scan_type'], strategy['extract_before_scan'])
+        return None
+    
+    def get_trivy_db_version(self) -> Optional[str]:
+        """Identify the downloaded Trivy DBs, or None when they are missing and scans update them on their own"""
+        versions = []
+        for db_dir in ('db', 'java-db'):
+            try:
+                with open(os.path.join(self.trivy_cache_dir, db_dir, 'metadata.json'), 'r', encoding='utf-8') as f:
+                    versions.append(str(json.load(f).get('UpdatedAt', '')))
+            except (OSError, ValueError):
+                return None
+        return '|'.join(versions)
+    
+    def prepare_scan_cache_dir(self) -> Optional[str]:
+        """Scan result directory for the current Trivy DBs; results persisted with any other DBs are deleted"""
+        if not self.trivy_db_version:
+            return None
+        
+        cache_root = os.path.join(self.output_dir, '.scan-cache')
+        current = hashlib.sha256(self.trivy_db_version.encode('utf-8')).hexdigest()[:16]
+        try:
+            with os.scandir(cache_root) as entries:
+                for entry in entries:
+                    if entry.name == current:
+                        continue
+                    # Every DB update makes the previous results unusable, so they are evicted instead of piling up
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            shutil.rmtree(entry.path)
+                        else:
+                            os.remove(entry.path)
+                    except OSError as e:
+                        self.logger.debug(f"Could not remove stale scan cache entry {entry.path}: {e}")
+        except FileNotFoundError:
+            pass
+        return os.path.join(cache_root, current)
+    
+    def get_scan_cache_path(self, checksum_key: tuple) -> Optional[str]:
+        """Path prefix of the persisted scan result for a checksum key, tied to the current Trivy DBs"""
+        if not self.scan_cache_dir:
+            return None
+        digest = hashlib.sha256(repr(checksum_key).encode('utf-8')).hexdigest()
+        return os.path.join(self.scan_cache_dir, digest)
+    
+    def load_cached_scan(self, checksum_key: tuple) -> bool:
+        """Check for a reusable scan result, loading one persisted by a previous run into the checksum cache"""
+        if checksum_key in self.checksum_scan_cache:
+            return True
+        
+        cache_path = self.get_scan_cache_path(checksum_key)
+        if not cache_path:
+            return False
+        try:
+            with open(f"{cache_path}.json", 'rb') as f:
+                content = f.read()
+            vulnerabilities = orjson.loads(content) if orjson is not None else json.loads(content)
+        except (OSError, ValueError):
+            return False
+        
+        report_path = f"{cache_path}.html"
+        self.checksum_scan_cache[checksum_key] = (vulnerabilities, report_path if os.path.exists(report_path) else None)
+        return True
+    
+    def store_cached_scan(self, checksum_key: tuple, vulnerabilities: List[Dict[str, Any]], html_content: Optional[str]):
+        """Persist a scan result for later runs; files are replaced atomically so readers never see partial data"""
+        cache_path = self.get_scan_cache_path(checksum_key)
+        if not cache_path:
+            return
+        try:
+            os.makedirs(self.scan_cache_dir, exist_ok=True)
+            if html_content:
+                with open(f"{cache_path}.html.tmp", 'w', encoding='utf-8') as f:
+                    f.write(html_content)
+                os.replace(f"{cache_path}.html.tmp", f"{cache_path}.html")
+            
+            if orjson is not None:
+                content = orjson.dumps(vulnerabilities)
+            else:
+                content = json.dumps(vulnerabilities, ensure_ascii=False).encode('utf-8')
+            with open(f"{cache_path}.json.tmp", 'wb') as f:
+                f.write(content)
+            os.replace(f"{cache_path}.json.tmp", f"{cache_path}.json")
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.debug(f"Could not persist scan result for {checksum_key[0]}: {e}")
+    
+    def prepare_trivy_cache(self) -> List[str]:
+        """Warm the shared Trivy cache and return the DB flags for vulnerability scans"""
+        db_args = []
+        for download_flag, skip_flag in (("--download-db-only", "--skip-db-update"),
+                                         ("--download-java-db-only", "--skip-java-db-update")):
+            try:
+                cmd = [self.trivy_path, "image", download_flag, "--cache-dir", self.trivy_cache_dir]
+                if not self.debug_mode:
+                    cmd.append("--quiet")
+                result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                      universal_newlines=True, timeout=600)
+                if result.returncode == 0:
+                    db_args.append(skip_flag)
+                else:
+                    self.logger.warning(f"Trivy {download_flag} failed, scans will update the DB themselves: {result.stderr.strip()}")
+            except Exception as e:
+                self.logger.warning(f"Trivy {download_flag} failed, scans will update the DB themselves: {e}")
+        
+        self.logger.info(f"Trivy cache directory: {self.trivy_cache_dir} (pre-downloaded: {', '.join(db_args) or 'none'})")
+        return db_args
+    
+    def start_trivy_server(self) -> List[str]:
+        """Start a local Trivy server and return the client flags for scans, or no flags to scan standalone"""
+        if not self.trivy_server_mode:
+            return []
+        
+        try:
+            # Let the OS pick a free loopback port
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+                probe.bind(("127.0.0.1", 0))
+                listen = f"127.0.0.1:{probe.getsockname()[1]}"
+            token = secrets.token_hex(16)
+            
+            cmd = [self.trivy_path, "server", "--listen", listen, "--token", token, "--cache-dir", self.trivy_cache_dir]
+            if "--skip-db-update" in self.trivy_db_args:
+                cmd.append("--skip-db-update")
+            self.trivy_server = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            atexit.register(self.stop_trivy_server)
+            
+            # The health check targets loopback, so HTTP(S)_PROXY settings must not route it through a proxy
+            opener = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+            deadline = time.monotonic() + 60
+            while time.monotonic() < deadline and self.trivy_server.poll() is None:
+                try:
+                    with opener.open(f"http://{listen}/healthz", timeout=2) as response:
+                        if response.status == 200:
+                            self.logger.info(f"Trivy server listening on {listen} - scans run in client mode")
+                            return ["--server", f"http://{listen}", "--token", token]
+                except OSError:
+                    time.sleep(0.5)
+            
+            self.logger.warning("Trivy server did not become ready, scans run in standalone mode")
+        except Exception as e:
+            self.logger.warning(f"Could not start Trivy server, scans run in standalone mode: {e}")
+        
+        self.stop_trivy_server()
+        return []
+    
+    def stop_trivy_server(self):
+        """Stop the local Trivy server if one is running"""
+        if self.trivy_server is None or self.trivy_server.poll() is not None:
+            return
+        self.trivy_server.terminate()
+        try:
+            self.trivy_server.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.trivy_server.kill()
+    
+    def get_trivy_cache_args(self, scan_type: str) -> List[str]:
+        """Cache flags for a Trivy command; DB skip and server flags only apply to vulnerability scans"""
+        if scan_type in ("fs", "image"):
+            return ["--cache-dir", self.trivy_cache_dir] + self.trivy_db_args + self.trivy_server_args
+        return ["--cache-dir", self.trivy_cache_dir]
+    
     def scan_with_trivy(self, file_path: str, scan_type: str = "fs") -> Optional[tuple]:
         """Scan a file or directory with Trivy. Returns (json_results, html_output)."""
         try:
@@ -868,19 +1190,11 @@ class CleanNexusScanner:
             if os.path.exists(file_path):
                 self.logger.debug(f"File size: {os.path.getsize(file_path)} bytes")
             
-            # Create output files for Trivy results
-            json_output_file = f"{file_path}.trivy.json"
-            html_output_file = f"{file_path}.trivy.html"
-            
-            self.logger.debug(f"JSON output: {json_output_file}")
-            self.logger.debug(f"HTML output: {html_output_file}")
-            
-            # JSON scan for programmatic processing
+            # JSON scan for programmatic processing; both reports are read from Trivy's stdout
             json_cmd = [
                 self.trivy_path,
                 scan_type,
                 "--format", "json",
-                "--output", json_output_file,
             ]
             
             # Add enhanced options for better package detection
@@ -901,6 +1215,7 @@ class CleanNexusScanner:
                         # Add offline mode to prevent network calls for better speed
                         # json_cmd.extend(["--offline-scan"])
                         
+            json_cmd.extend(self.get_trivy_cache_args(scan_type))
             json_cmd.append(file_path)
             
             # HTML scan using Trivy's built-in template
@@ -915,13 +1230,13 @@ class CleanNexusScanner:
                 scan_type,
                 "--format", "template",
                 "--template", f"@{html_template_path}",
-                "--output", html_output_file,
             ]
             
             # Apply same enhancements to HTML command
             if scan_type == "fs":
                 html_cmd.extend(["--scanners", "vuln"])
                 
+            html_cmd.extend(self.get_trivy_cache_args(scan_type))
             html_cmd.append(file_path)
             
             # Add --quiet flag only if not in debug mode
@@ -931,73 +1246,66 @@ class CleanNexusScanner:
             
             self.logger.debug(f"JSON command: {' '.join(json_cmd)}")
             
-            # Run JSON scan
-            json_result = subprocess.run(json_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, 
-                                       universal_newlines=True, timeout=300)
+            # Run JSON scan; stdout stays as bytes so it is parsed without a text decoding pass
+            json_result = subprocess.run(json_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=300)
+            json_stderr = json_result.stderr.decode('utf-8', errors='replace')
             
             self.logger.debug(f"JSON scan return code: {json_result.returncode}")
-            if json_result.stdout:
-                self.logger.debug(f"JSON scan stdout: {json_result.stdout}")
-            if json_result.stderr:
-                self.logger.debug(f"JSON scan stderr: {json_result.stderr}")
+            self.logger.debug(f"JSON output size: {len(json_result.stdout)} bytes")
+            if json_stderr:
+                self.logger.debug(f"JSON scan stderr: {json_stderr}")
                 
             if json_result.returncode != 0:
                 self.logger.error(f"Trivy JSON scan failed for {file_path}")
                 self.logger.error(f"Return code: {json_result.returncode}")
-                self.logger.error(f"STDERR: {json_result.stderr}")
+                self.logger.error(f"STDERR: {json_stderr}")
                 return None
             
-            self.logger.debug(f"HTML command: {' '.join(html_cmd)}")
+            # Render the HTML report from the JSON result rather than analysing the target a second time
+            html_result = None
+            if self.trivy_convert_supported and json_result.stdout.strip():
+                html_result = self.convert_trivy_report(json_result.stdout, file_path, html_template_path)
             
-            # Run HTML scan
-            html_result = subprocess.run(html_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, 
-                                       universal_newlines=True, timeout=300)
+            if html_result is None:
+                self.logger.debug(f"HTML command: {' '.join(html_cmd)}")
+                
+                # Run HTML scan; Trivy writes UTF-8 regardless of the platform locale
+                html_result = subprocess.run(html_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=300)
             
             self.logger.debug(f"HTML scan return code: {html_result.returncode}")
-            if html_result.stdout:
-                self.logger.debug(f"HTML scan stdout: {html_result.stdout}")
             if html_result.stderr:
-                self.logger.debug(f"HTML scan stderr: {html_result.stderr}")
+                self.logger.debug(f"HTML scan stderr: {html_result.stderr.decode('utf-8', errors='replace')}")
             
             json_data = None
             html_content = None
             
-            # Read JSON results and save to reports directory
-            if os.path.exists(json_output_file):
+            # Parse JSON results and save to reports directory
+            json_content = json_result.stdout
+            if json_content.strip():
                 try:
-                    with open(json_output_file, 'r', encoding='utf-8') as f:
-                        json_content = f.read()
-                        self.logger.debug(f"JSON file size: {len(json_content)} characters")
-                        if json_content.strip():
-                            json_data = json.loads(json_content)
-                            self.logger.debug(f"JSON parsed successfully, type: {type(json_data)}")
-                        else:
-                            self.logger.debug("JSON file is empty")
+                    json_data = orjson.loads(json_content) if orjson is not None else json.loads(json_content)
+                    self.logger.debug(f"JSON parsed successfully, type: {type(json_data)}")
                     
                     # Save JSON report to individual files directory (actual Trivy JSON output)
-                    if hasattr(self, 'individual_files_dir') and json_content.strip():
+                    if hasattr(self, 'individual_files_dir'):
                         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                         base_name = os.path.basename(file_path).replace('.', '_')
                         json_report_path = os.path.join(self.individual_files_dir, 
                                                       f"{base_name}_trivy_{timestamp}.json")
                         # Save the raw Trivy JSON output (not our custom structure)
-                        with open(json_report_path, 'w', encoding='utf-8') as f:
+                        with open(json_report_path, 'wb') as f:
                             f.write(json_content)
                         self.logger.info(f"Trivy JSON report saved: {json_report_path}")
-                    
-                    os.remove(json_output_file)
-                    self.logger.debug("Temporary JSON output file cleaned up")
                 except Exception as e:
                     self.logger.error(f"Error parsing JSON results: {e}")
             else:
-                self.logger.warning(f"JSON output file not found: {json_output_file}")
+                self.logger.warning(f"Trivy produced no JSON output for {file_path}")
             
-            # Read HTML results and save to reports directory
-            if os.path.exists(html_output_file):
+            # Take HTML results and save to reports directory
+            if html_result.returncode == 0:
                 try:
-                    with open(html_output_file, 'r', encoding='utf-8') as f:
-                        html_content = f.read()
-                        self.logger.debug(f"HTML file size: {len(html_content)} characters")
+                    html_content = html_result.stdout.decode('utf-8', errors='replace')
+                    self.logger.debug(f"HTML output size: {len(html_content)} characters")
                     
                     # Save HTML report to individual files directory (actual Trivy HTML output)
                     if hasattr(self, 'individual_files_dir') and html_content.strip():
@@ -1009,13 +1317,10 @@ class CleanNexusScanner:
                         with open(html_report_path, 'w', encoding='utf-8') as f:
                             f.write(html_content)
                         self.logger.info(f"Trivy HTML report saved: {html_report_path}")
-                    
-                    os.remove(html_output_file)
-                    self.logger.debug("Temporary HTML output file cleaned up")
                 except Exception as e:
-                    self.logger.error(f"Error reading HTML results: {e}")
+                    self.logger.error(f"Error saving HTML results: {e}")
             else:
-                self.logger.warning(f"HTML output file not found: {html_output_file}")
+                self.logger.warning(f"Trivy HTML scan failed for {file_path}")
                 
             self.logger.debug(f"=== Trivy scan completed ===")
             return (json_data, html_content)
@@ -1028,6 +1333,45 @@ class CleanNexusScanner:
             self.logger.debug(f"Exception details: ", exc_info=True)
             return None
     
+    def detect_trivy_convert(self) -> bool:
+        """Check once whether this Trivy release has the convert command"""
+        try:
+            result = subprocess.run([self.trivy_path, "convert", "--help"], stdout=subprocess.PIPE,
+                                    stderr=subprocess.STDOUT, timeout=30)
+        except (OSError, subprocess.SubprocessError) as e:
+            self.logger.debug(f"Trivy convert check failed: {e}")
+            return False
+        
+        # Releases without the command may print the general help instead, so look for convert's own usage line
+        if result.returncode != 0 or b"trivy convert" not in result.stdout:
+            self.logger.info("Trivy convert is unavailable - HTML reports will be produced by a second scan")
+            return False
+        return True
+    
+    def convert_trivy_report(self, json_content: bytes, file_path: str, html_template_path: str) -> Optional[subprocess.CompletedProcess]:
+        """Render the HTML template from a Trivy JSON report with trivy convert. Returns None if that is unavailable."""
+        report_file = f"{file_path}.trivy.json"
+        try:
+            with open(report_file, 'wb') as f:
+                f.write(json_content)
+            convert_cmd = [self.trivy_path, "convert", "--format", "template", "--template", f"@{html_template_path}", report_file]
+            self.logger.debug(f"HTML convert command: {' '.join(convert_cmd)}")
+            result = subprocess.run(convert_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=300)
+        except (OSError, subprocess.SubprocessError) as e:
+            self.logger.debug(f"Trivy convert failed for {file_path}: {e}")
+            return None
+        finally:
+            try:
+                os.remove(report_file)
+            except OSError:
+                pass
+        
+        if result.returncode != 0:
+            # Only this report falls back to a second scan; support itself was established at startup
+            self.logger.debug(f"Trivy convert failed for {file_path}: {result.stderr.decode('utf-8', errors='replace')}")
+            return None
+        return result
+    
     def extract_vulnerabilities(self, trivy_results: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract vulnerability information from Trivy results."""
         vulnerabilities = []
@@ -1038,7 +1382,7 @@ class CleanNexusScanner:
         
         self.logger.debug(f"Trivy results structure: {list(trivy_results.keys())}")
         
-        results = trivy_results.get('Results', [])
+        results = trivy_results.get('Results') or []  # Trivy emits null when nothing was detected
         self.logger.debug(f"Found {len(results)} result sections in Trivy output")
         
         for i, result in enumerate(results):
@@ -1054,22 +1398,31 @@ class CleanNexusScanner:
                 continue
             
             for vuln in vulns:
-                vulnerability = {
+                title, description, references = self.share_advisory_text(vuln)
+                vulnerabilities.append({
                     'target': target,
                     'vulnerability_id': vuln.get('VulnerabilityID', ''),
                     'pkg_name': vuln.get('PkgName', ''),
                     'pkg_version': vuln.get('InstalledVersion', ''),
-                    'severity': vuln.get('Severity', 'UNKNOWN'),
-                    'title': vuln.get('Title', ''),
-                    'description': vuln.get('Description', ''),
+                    'severity': sys.intern(vuln.get('Severity') or 'UNKNOWN'),
+                    'title': title,
+                    'description': description,
                     'fixed_version': vuln.get('FixedVersion', ''),
-                    'references': vuln.get('References', [])
-                }
-                vulnerabilities.append(vulnerability)
+                    'references': references
+                })
         
         self.logger.debug(f"Extracted {len(vulnerabilities)} vulnerabilities total")
         return vulnerabilities
     
+    def share_advisory_text(self, vuln: Dict[str, Any]) -> tuple:
+        """Return (title, description, references) for a Trivy finding, reusing the first copy seen of identical advisory text."""
+        references = vuln.get('References', [])
+        key = (vuln.get('VulnerabilityID', ''), vuln.get('Title', ''), vuln.get('Description', ''), tuple(references or ()))
+        shared = self.advisory_texts.get(key)
+        if shared is None:
+            shared = self.advisory_texts[key] = (key[1], key[2], references)
+        return shared
+    
     def scan_with_strategy(self, file_path: str, strategy: dict, artifact_type: str) -> Optional[tuple]:
         """Scan a file using the intelligent strategy. Returns (json_results, html_output)."""
         try:
@@ -1077,7 +1430,10 @@ class CleanNexusScanner:
             actual_scan_path = file_path
             temp_extract_dir = None
             
-            if strategy.get('extract_before_scan'):
+            # Trivy reads Java archives natively, so they are never unpacked to disk
+            if strategy.get('extract_before_scan') and file_path.lower().endswith(self.native_archive_suffixes):
+                self.logger.debug(f"Skipping extraction of {file_path} - Trivy scans this archive type natively")
+            elif strategy.get('extract_before_scan'):
                 temp_extract_dir = f"{file_path}_extracted"
                 if self.extract_archive(file_path, temp_extract_dir):
                     actual_scan_path = temp_extract_dir
@@ -1089,13 +1445,9 @@ class CleanNexusScanner:
             scan_type = strategy.get('scan_type', 'fs')
             results = self.scan_with_trivy(actual_scan_path, scan_type)
             
-            # Clean up extracted files
-            if temp_extract_dir and os.path.exists(temp_extract_dir):
-                try:
-                    import shutil
-                    shutil.rmtree(temp_extract_dir)
-                except Exception as e:
-                    self.logger.warning(f"Could not clean up extracted directory {temp_extract_dir}: {e}")
+            # Clean up extracted files in the background
+            if temp_extract_dir:
+                self.schedule_cleanup(temp_extract_dir)
             
             return results
             
@@ -1114,14 +1466,16 @@ class CleanNexusScanner:
             archive_lower = archive_path.lower()
             extracted = False
             
-            if archive_lower.endswith('.zip') or archive_lower.endswith('.jar') or archive_lower.endswith('.war'):
+            if archive_lower.endswith('.zip'):
                 with zipfile.ZipFile(archive_path, 'r') as zip_ref:
                     zip_ref.extractall(extract_dir)
                 extracted = True
             
             elif archive_lower.endswith(('.tar.gz', '.tgz')):
-                with tarfile.open(archive_path, 'r:gz') as tar_ref:
-                    tar_ref.extractall(extract_dir)
+                # Prefer system tar with parallel pigz decompression, fall back to tarfile
+                if not self.extract_tar_with_pigz(archive_path, extract_dir):
+                    with tarfile.open(archive_path, 'r:gz') as tar_ref:
+                        tar_ref.extractall(extract_dir)
                 extracted = True
             
             elif archive_lower.endswith('.tar'):
@@ -1143,6 +1497,52 @@ class CleanNexusScanner:
             self.logger.error(f"Error extracting {archive_path}: {e}")
             return False
     
+    def schedule_cleanup(self, path: str):
+        """Queue a downloaded file or extracted directory for deletion by the janitor thread."""
+        if not os.path.exists(path):
+            return
+        try:
+            # Rename first so a later download reusing the same name is never deleted by mistake
+            pending_path = f"{path}.pending-delete-{next(self._cleanup_counter)}"
+            os.rename(path, pending_path)
+        except OSError as e:
+            self.logger.debug(f"Could not rename {path} for cleanup, deleting in place: {e}")
+            pending_path = path
+        self.cleanup_queue.put(pending_path)
+    
+    def _cleanup_worker(self):
+        """Delete queued paths in the background (daemon thread)."""
+        while True:
+            path = self.cleanup_queue.get()
+            try:
+                if os.path.isdir(path):
+                    shutil.rmtree(path, ignore_errors=True)
+                    self.logger.debug(f"✅ Removed directory: {os.path.basename(path)}")
+                elif os.path.exists(path):
+                    file_size = os.path.getsize(path)
+                    os.remove(path)
+                    self.logger.debug(f"✅ Freed {file_size:,} bytes - deleted: {os.path.basename(path)}")
+            except Exception as e:
+                self.logger.debug(f"Could not delete {path}: {e}")
+            finally:
+                self.cleanup_queue.task_done()
+    
+    def extract_tar_with_pigz(self, archive_path: str, extract_dir: str) -> bool:
+        """Extract a gzip tarball with system tar + pigz. Returns False if unavailable or failed."""
+        if not (self.tar_path and self.pigz_path):
+            return False
+        
+        tar_cmd = [self.tar_path, f"--use-compress-program={self.pigz_path}", "-xf", archive_path, "-C", extract_dir]
+        try:
+            result = subprocess.run(tar_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                    universal_newlines=True, timeout=300)
+            if result.returncode == 0:
+                return True
+            self.logger.debug(f"tar/pigz extraction failed for {archive_path}: {result.stderr.strip()}")
+        except Exception as e:
+            self.logger.debug(f"tar/pigz extraction error for {archive_path}: {e}")
+        return False
+    
     def enhance_nodejs_package_for_scanning(self, extract_dir: str):
         """
         Enhance extracted Node.js package to ensure Trivy can scan it properly.
@@ -1275,15 +1675,24 @@ class CleanNexusScanner:
         total_components_found = 0
         format_counts = Counter()
         
-        for repo in repositories:
-            repo_name = repo['name']
+        # Fetch component pages for all repositories concurrently over the shared session
+        max_workers = max(1, min(self.component_fetch_workers, len(repositories)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            component_futures = []
+            for repo in repositories:
+                self.logger.info(f"🔍 Fetching components from: {repo['name']} ({repo.get('format', 'unknown')}, {repo.get('type', 'hosted')})")
+                component_futures.append(
+                    executor.submit(self.get_repository_components, repo['name'], repo.get('type', 'hosted'))
+                )
+
+        for repo, future in zip(repositories, component_futures):
+            # Interned so every vulnerability record of the repository shares one key object
+            repo_name = sys.intern(repo['name'])
             repo_format = repo.get('format', 'unknown')
-            repo_type = repo.get('type', 'hosted')
             format_counts[repo_format] += 1
-            
-            self.logger.info(f"🔍 Fetching components from: {repo_name} ({repo_format}, {repo_type})")
+
             try:
-                components = self.get_repository_components(repo_name, repo_type)
+                components = future.result()
                 repository_components_cache[repo_name] = {
                     'repo': repo,
                     'components': components,
@@ -1317,7 +1726,11 @@ class CleanNexusScanner:
             self.logger.warning("⚠️ Failed to generate components CSV")
         
         all_vulnerabilities = []
-        scan_timestamp = datetime.now().isoformat()
+        # One UTC instant for the run: ISO form inside the reports, compact form in file and folder names
+        scan_time = datetime.now(timezone.utc)
+        scan_timestamp = scan_time.isoformat()
+        file_stamp = scan_time.strftime('%Y%m%dT%H%M%SZ')
+        self.open_results_stream(scan_timestamp, file_stamp)
         
         # Pre-scan diagnostic summary
         self.logger.info("=" * 60)
@@ -1389,293 +1802,452 @@ class CleanNexusScanner:
                     self.logger.warning(f"Repository {repo_name} is empty - no components to scan")
                 continue
 
-            for i, component in enumerate(components, 1):
-                component_name = component.get('name', 'unknown')
-                component_version = component.get('version', 'unknown')
+            # Plan assets lazily and keep a bounded window of downloads running ahead of Trivy
+            scan_jobs = self.iter_asset_scan_jobs(repo_name, repo_format, components, scan_timestamp, all_vulnerabilities)
+            self.run_scan_jobs(scan_jobs, all_vulnerabilities)
+        
+        # Individual reports must be on disk before temp cleanup and the move into the timestamped folder
+        self.report_write_pool.shutdown(wait=True)
+        
+        # Save results
+        self.save_results(scan_timestamp)
+        
+        # One aggregation pass provides the grouping, severity counts and summaries for the combined report
+        aggregates = self.aggregate_vulnerabilities(all_vulnerabilities)
+        self.generate_combined_report(all_vulnerabilities, scan_timestamp, file_stamp, aggregates)
+        self.save_scan_issues_report(scan_timestamp, file_stamp)  # Save separate issues report
+        
+        # Clean up temporary individual reports if retention is disabled
+        if not self.retain_individual_reports:
+            self.cleanup_temporary_reports()
+        
+        # Wait for queued background deletions before the final temp directory sweep
+        self.cleanup_queue.join()
+        
+        # Always clean up downloaded temp files (but preserve individual reports if configured)
+        self.cleanup_downloaded_files()
+            
+        self.print_summary()
+        
+        # Move all reports to timestamped folder
+        self.move_reports_to_timestamped_folder(file_stamp)
+    
+    def iter_asset_scan_jobs(self, repo_name: str, repo_format: str, components: List[Dict[str, Any]],
+                             scan_timestamp: str, all_vulnerabilities: List[Dict[str, Any]]):
+        """Walk a repository's components and yield one scan job per asset that must be downloaded.
+
+        Skips, date filtering, artifact detection and checksum reuse are resolved here, so only
+        assets that really need a download and a Trivy scan are yielded. Docker components are
+        scanned inline because they are pulled by Trivy rather than downloaded.
+        """
+        component_count = len(components)
+        
+        for i, component in enumerate(components, 1):
+            component_name = sys.intern(component.get('name') or 'unknown')
+            component_version = component.get('version', 'unknown')
+            
+            self.logger.info(f"Processing component {i}/{component_count}: {component_name}:{component_version}")
+            
+            # Analyze component assets
+            assets = component.get('assets', [])
+            asset_count = len(assets)
+            self.logger.info(f"  Component has {asset_count} assets")
+            
+            # Log asset details for diagnostic purposes
+            for j, asset in enumerate(assets[:5], 1):  # Log first 5 assets
+                asset_name = asset.get('path', asset.get('name', 'unknown'))
+                asset_size = asset.get('fileSize', 'unknown')
+                download_url = asset.get('downloadUrl', '')
+                self.logger.debug(f"    Asset {j}: {asset_name} (size: {asset_size}, has_url: {bool(download_url)})")
+            
+            if asset_count > 5:
+                self.logger.debug(f"    ... and {asset_count - 5} more assets")
+            
+            # Handle different repository formats
+            if repo_format == 'docker':
+                self.logger.info(f"  Using Docker scanning strategy for {component_name}:{component_version}")
+                # For Docker repositories, scan container images
+                vulnerabilities = self.scan_docker_components(component, repo_name, scan_timestamp)
+                all_vulnerabilities.extend(vulnerabilities)
+                self.write_results(vulnerabilities)
+                continue
+            
+            self.logger.info(f"  Using asset-by-asset scanning strategy")
+            # For other formats, scan individual assets
+            for k, asset in enumerate(assets, 1):
+                asset_name = asset.get('path', asset.get('name', 'unknown'))
+                download_url = asset.get('downloadUrl', '')
                 
-                self.logger.info(f"Processing component {i}/{component_count}: {component_name}:{component_version}")
+                self.logger.info(f"    Processing asset {k}/{asset_count}: {asset_name}")
+
+                # Skip checksum/signature and metadata files before any detection or download work
+                if asset_name.lower().endswith(self.skip_asset_suffixes):
+                    asset_info = {
+                        'repository': repo_name,
+                        'component': component_name,
+                        'asset': asset_name,
+                        'artifact_type': 'checksum_signature'
+                    }
+                    self.log_scan_issue('skip', asset_info, 'Checksum/signature or repository metadata file - not scannable', f"Download URL: {download_url}")
+                    continue
+
+                if not download_url:
+                    self.logger.warning(f"    Asset {asset_name} has no download URL - skipping")
+                    continue
                 
-                # Analyze component assets
-                assets = component.get('assets', [])
-                asset_count = len(assets)
-                self.logger.info(f"  Component has {asset_count} assets")
-                
-                # Log asset details for diagnostic purposes
-                for j, asset in enumerate(assets[:5], 1):  # Log first 5 assets
-                    asset_name = asset.get('path', asset.get('name', 'unknown'))
-                    asset_size = asset.get('fileSize', 'unknown')
-                    download_url = asset.get('downloadUrl', '')
-                    self.logger.debug(f"    Asset {j}: {asset_name} (size: {asset_size}, has_url: {bool(download_url)})")
-                
-                if asset_count > 5:
-                    self.logger.debug(f"    ... and {asset_count - 5} more assets")
-                
-                # Handle different repository formats
-                if repo_format == 'docker':
-                    self.logger.info(f"  Using Docker scanning strategy for {component_name}:{component_version}")
-                    # For Docker repositories, scan container images
-                    vulnerabilities = self.scan_docker_components(component, repo_name, scan_timestamp)
-                    all_vulnerabilities.extend(vulnerabilities)
-                else:
-                    self.logger.info(f"  Using asset-by-asset scanning strategy")
-                    # For other formats, scan individual assets
-                    for k, asset in enumerate(assets, 1):
-                        asset_name = asset.get('path', asset.get('name', 'unknown'))
-                        download_url = asset.get('downloadUrl', '')
-                        
-                        self.logger.info(f"    Processing asset {k}/{asset_count}: {asset_name}")
-                        
-                        if not download_url:
-                            self.logger.warning(f"    Asset {asset_name} has no download URL - skipping")
-                            continue
-                        
-                        # Apply date-based filtering if configured
-                        if self.scan_artifacts_from_date:
-                            asset_last_modified = asset.get('lastModified')
-                            if asset_last_modified:
-                                try:
-                                    # Parse the asset's last modified date with Python 2.7+ compatible parsing
-                                    # Handle common ISO formats from Nexus: 2025-09-15T10:30:45.123Z
-                                    date_str = asset_last_modified
-                                    
-                                    # Remove timezone indicators for consistent parsing
-                                    if date_str.endswith('Z'):
-                                        date_str = date_str[:-1]
-                                    elif '+' in date_str:
-                                        date_str = date_str.split('+')[0]
-                                    elif date_str.endswith('+00:00'):
-                                        date_str = date_str[:-6]
-                                    
-                                    # Handle microseconds - truncate to milliseconds if needed
-                                    if '.' in date_str:
-                                        date_part, frac_part = date_str.split('.')
-                                        # Keep only first 6 digits (microseconds) or 3 digits (milliseconds)
-                                        if len(frac_part) > 6:
-                                            frac_part = frac_part[:6]
-                                        elif len(frac_part) == 3:
-                                            frac_part = frac_part + '000'  # Convert milliseconds to microseconds
-                                        date_str = f"{date_part}.{frac_part}"
-                                    
-                                    # Parse using strptime (compatible with older Python versions)
-                                    try:
-                                        if '.' in date_str:
-                                            asset_date = datetime.strptime(date_str, '%Y-%m-%dT%H:%M:%S.%f')
-                                        else:
-                                            asset_date = datetime.strptime(date_str, '%Y-%m-%dT%H:%M:%S')
-                                    except ValueError:
-                                        # Fallback: try parsing just the date part
-                                        date_only = date_str.split('T')[0]
-                                        asset_date = datetime.strptime(date_only, '%Y-%m-%d')
-                                    
-                                    if asset_date < self.scan_artifacts_from_date:
-                                        self.logger.info(f"    Skipping asset {asset_name} - uploaded {asset_date.strftime('%Y-%m-%d')} (before filter date {self.scan_artifacts_from_date.strftime('%Y-%m-%d')})")
-                                        self.scan_issues['skipped_files'].append({
-                                            'repository': repo_name,
-                                            'component': component_name,
-                                            'asset': asset_name,
-                                            'reason': f'Uploaded before filter date ({asset_date.strftime("%Y-%m-%d")} < {self.scan_artifacts_from_date.strftime("%Y-%m-%d")})',
-                                            'upload_date': asset_date.strftime('%Y-%m-%d')
-                                        })
-                                        continue
-                                    else:
-                                        self.logger.debug(f"    Asset {asset_name} passed date filter - uploaded {asset_date.strftime('%Y-%m-%d')}")
-                                except (ValueError, TypeError) as e:
-                                    self.logger.warning(f"    Could not parse asset date '{asset_last_modified}' for {asset_name}: {e}")
-                                    self.logger.debug(f"    Including asset {asset_name} in scan due to date parsing failure")
-                            else:
-                                self.logger.warning(f"    Asset {asset_name} has no lastModified date - including in scan")
-                        
-                        # Detect artifact type and determine scanning strategy
-                        artifact_type = self.detect_artifact_type(asset_name, repo_format)
-                        self.statistics['artifact_types'][artifact_type] += 1
-                        self.logger.info(f"    Detected artifact type: {artifact_type}")
-                        
-                        strategy = self.determine_scan_strategy(artifact_type, asset_name, repo_format)
-                        self.logger.info(f"    Scan strategy: {strategy['reason']}")
-                        self.logger.debug(f"    Full strategy: {strategy}")
-                        
-                        if strategy['skip_scan']:
-                            # Log skip with detailed asset information
-                            asset_info = {
-                                'repository': repo_name,
-                                'component': component_name,
-                                'asset': asset_name,
-                                'artifact_type': artifact_type
-                            }
-                            self.log_scan_issue('skip', asset_info, strategy['reason'], f"Download URL: {download_url}")
-                            self.logger.info(f"    SKIPPED: {strategy['reason']}")
-                            continue
-                        
-                        self.logger.info(f"    SCANNING: {asset_name} (Type: {artifact_type})")
-                        self.logger.info(f"    Strategy: {strategy['reason']}")
-                        self.stats['assets_scanned'] += 1
-                        
-                        # Create local filename for download
-                        safe_filename = asset_name.replace('/', '_').replace('\\', '_')
-                        local_path = os.path.join(self.temp_dir, safe_filename)
-                        
-                        self.logger.debug(f"    Download URL: {download_url}")
-                        self.logger.debug(f"    Local path: {local_path}")
-                        
-                        # Download and scan
-                        download_start = datetime.now()
-                        if self.download_asset(download_url, local_path):
-                            download_time = str(datetime.now() - download_start)
-                            file_size = os.path.getsize(local_path) if os.path.exists(local_path) else 0
-                            self.logger.info(f"    Downloaded in {download_time} (size: {file_size:,} bytes)")
+                # Apply date-based filtering if configured
+                if self.scan_artifacts_from_date:
+                    asset_last_modified = asset.get('lastModified')
+                    if asset_last_modified:
+                        try:
+                            # Parse the asset's last modified date with Python 2.7+ compatible parsing
+                            # Handle common ISO formats from Nexus: 2025-09-15T10:30:45.123Z
+                            date_str = asset_last_modified
                             
-                            # Use intelligent scanning strategy
-                            scan_start_time = datetime.now()
-                            scan_results = self.scan_with_strategy(local_path, strategy, artifact_type)
-                            scan_end_time = datetime.now()
-                            scan_duration = str(scan_end_time - scan_start_time)
+                            # Remove timezone indicators for consistent parsing
+                            if date_str.endswith('Z'):
+                                date_str = date_str[:-1]
+                            elif '+' in date_str:
+                                date_str = date_str.split('+')[0]
+                            elif date_str.endswith('+00:00'):
+                                date_str = date_str[:-6]
                             
-                            self.logger.info(f"    Scan completed in {scan_duration}")
+                            # Handle microseconds - truncate to milliseconds if needed
+                            if '.' in date_str:
+                                date_part, frac_part = date_str.split('.')
+                                # Keep only first 6 digits (microseconds) or 3 digits (milliseconds)
+                                if len(frac_part) > 6:
+                                    frac_part = frac_part[:6]
+                                elif len(frac_part) == 3:
+                                    frac_part = frac_part + '000'  # Convert milliseconds to microseconds
+                                date_str = f"{date_part}.{frac_part}"
                             
-                            if scan_results and scan_results[0]:  # Check JSON results
-                                json_data, html_content = scan_results
-                                vulnerabilities = self.extract_vulnerabilities(json_data)
-                                vuln_count = len(vulnerabilities)
-                                self.stats['vulnerabilities_found'] += vuln_count
-                                
-                                self.logger.info(f"    SCAN RESULT: Found {vuln_count} vulnerabilities")
-                                
-                                if vuln_count > 0:
-                                    # Log vulnerability summary by severity
-                                    severity_counts = {}
-                                    for vuln in vulnerabilities:
-                                        severity = vuln.get('severity', 'UNKNOWN')
-                                        severity_counts[severity] = severity_counts.get(severity, 0) + 1
-                                    
-                                    severity_summary = ", ".join([f"{severity}: {count}" for severity, count in severity_counts.items()])
-                                    self.logger.info(f"    Vulnerability breakdown: {severity_summary}")
-                                
-                                # Log successful scan with details
-                                file_size = os.path.getsize(local_path) if os.path.exists(local_path) else 0
-                                asset_info = {
+                            # Parse using strptime (compatible with older Python versions)
+                            try:
+                                if '.' in date_str:
+                                    asset_date = datetime.strptime(date_str, '%Y-%m-%dT%H:%M:%S.%f')
+                                else:
+                                    asset_date = datetime.strptime(date_str, '%Y-%m-%dT%H:%M:%S')
+                            except ValueError:
+                                # Fallback: try parsing just the date part
+                                date_only = date_str.split('T')[0]
+                                asset_date = datetime.strptime(date_only, '%Y-%m-%d')
+                            
+                            if asset_date < self.scan_artifacts_from_date:
+                                self.logger.info(f"    Skipping asset {asset_name} - uploaded {asset_date.strftime('%Y-%m-%d')} (before filter date {self.scan_artifacts_from_date.strftime('%Y-%m-%d')})")
+                                self.scan_issues['skipped_files'].append({
                                     'repository': repo_name,
                                     'component': component_name,
                                     'asset': asset_name,
-                                    'artifact_type': artifact_type
-                                }
-                                scan_details = {
-                                    'scan_strategy': strategy['reason'],
-                                    'vulnerabilities_found': len(vulnerabilities),
-                                    'scan_type': strategy['scan_type'],
-                                    'file_size': f"{file_size:,} bytes",
-                                    'scan_duration': scan_duration,
-                                    'trivy_command': f"trivy {strategy['scan_type']}"
-                                }
-                                self.log_successful_scan(asset_info, scan_details)
-                                
-                                # Add metadata to each vulnerability
-                                for vuln in vulnerabilities:
-                                    vuln.update({
-                                        'repository': repo_name,
-                                        'repository_format': repo_format,
-                                        'component': component_name,
-                                        'component_version': component_version,
-                                        'asset': asset_name,
-                                        'artifact_type': artifact_type,
-                                        'scan_strategy': strategy['reason'],
-                                        'scan_timestamp': scan_timestamp
-                                    })
-                                
-                                all_vulnerabilities.extend(vulnerabilities)
-                                
-                                # Save individual HTML report for all successful scans
-                                if html_content:
-                                    self.save_individual_html_report(html_content, component_name, asset_name, repo_name, scan_timestamp, len(vulnerabilities))
-                                
-                                # Immediately delete downloaded file to free up space
-                                try:
-                                    if os.path.exists(local_path):
-                                        file_size = os.path.getsize(local_path)
-                                        os.remove(local_path)
-                                        self.logger.debug(f"✅ Freed {file_size:,} bytes - deleted: {os.path.basename(local_path)}")
-                                except Exception as e:
-                                    self.logger.debug(f"Could not delete downloaded file {local_path}: {e}")
-                                
-                                if vulnerabilities:
-                                    self.logger.info(f"Found {len(vulnerabilities)} vulnerabilities in {asset_name}")
+                                    'reason': f'Uploaded before filter date ({asset_date.strftime("%Y-%m-%d")} < {self.scan_artifacts_from_date.strftime("%Y-%m-%d")})',
+                                    'upload_date': asset_date.strftime('%Y-%m-%d')
+                                })
+                                continue
                             else:
-                                self.logger.warning(f"    SCAN FAILED: Trivy scan returned no results")
-                                # Log scan error with detailed information
-                                asset_info = {
-                                    'repository': repo_name,
-                                    'component': component_name,
-                                    'asset': asset_name,
-                                    'artifact_type': artifact_type
-                                }
-                                self.log_scan_issue('error', asset_info, 'Trivy scan failed - no results returned', f"Strategy: {strategy['reason']}, Path: {local_path}")
-                                self.stats['scan_errors'] += 1
-                                
-                                # Delete downloaded file even if scan failed to free up space
-                                try:
-                                    if os.path.exists(local_path):
-                                        file_size = os.path.getsize(local_path)
-                                        os.remove(local_path)
-                                        self.logger.debug(f"✅ Freed {file_size:,} bytes - deleted: {os.path.basename(local_path)} (scan failed)")
-                                except Exception as e:
-                                    self.logger.debug(f"Could not delete downloaded file {local_path}: {e}")
-                        else:
-                            self.logger.error(f"    DOWNLOAD FAILED: Could not download {asset_name}")
-                            # Log download error
-                            # Log download error
-                            asset_info = {
-                                'repository': repo_name,
-                                'component': component_name,
-                                'asset': asset_name,
-                                'artifact_type': artifact_type
-                            }
-                            self.log_scan_issue('error', asset_info, 'Asset download failed', f"URL: {download_url}")
-                            
-                            # Clean up downloaded file
-                            try:
-                                os.remove(local_path)
-                            except:
-                                pass
+                                self.logger.debug(f"    Asset {asset_name} passed date filter - uploaded {asset_date.strftime('%Y-%m-%d')}")
+                        except (ValueError, TypeError) as e:
+                            self.logger.warning(f"    Could not parse asset date '{asset_last_modified}' for {asset_name}: {e}")
+                            self.logger.debug(f"    Including asset {asset_name} in scan due to date parsing failure")
+                    else:
+                        self.logger.warning(f"    Asset {asset_name} has no lastModified date - including in scan")
+                
+                # Detect artifact type and determine scanning strategy
+                artifact_type = self.detect_artifact_type(asset_name, repo_format)
+                self.statistics['artifact_types'][artifact_type] += 1
+                self.logger.info(f"    Detected artifact type: {artifact_type}")
+                
+                strategy = self.determine_scan_strategy(artifact_type, asset_name, repo_format)
+                self.logger.info(f"    Scan strategy: {strategy['reason']}")
+                self.logger.debug(f"    Full strategy: {strategy}")
+                
+                if strategy['skip_scan']:
+                    # Log skip with detailed asset information
+                    asset_info = {
+                        'repository': repo_name,
+                        'component': component_name,
+                        'asset': asset_name,
+                        'artifact_type': artifact_type
+                    }
+                    self.log_scan_issue('skip', asset_info, strategy['reason'], f"Download URL: {download_url}")
+                    self.logger.info(f"    SKIPPED: {strategy['reason']}")
+                    continue
+                
+                self.logger.info(f"    SCANNING: {asset_name} (Type: {artifact_type})")
+                self.logger.info(f"    Strategy: {strategy['reason']}")
+                self.stats['assets_scanned'] += 1
+                
+                vuln_metadata = {
+                    'repository': repo_name,
+                    'repository_format': repo_format,
+                    'component': component_name,
+                    'component_version': component_version,
+                    'asset': asset_name,
+                    'artifact_type': artifact_type,
+                    'scan_strategy': strategy['reason'],
+                    'scan_timestamp': scan_timestamp
+                }
+                
+                # Reuse the result of an identical asset (same Nexus checksum) scanned earlier in this or a previous run
+                checksum_key = self.get_checksum_cache_key(asset, strategy)
+                if checksum_key and self.load_cached_scan(checksum_key):
+                    asset_info = {
+                        'repository': repo_name,
+                        'component': component_name,
+                        'asset': asset_name,
+                        'artifact_type': artifact_type
+                    }
+                    self.reuse_cached_scan(asset, asset_info, strategy, vuln_metadata, checksum_key, all_vulnerabilities)
+                    continue
+                
+                # Create local filename for download; each asset gets its own directory so concurrent
+                # scans never share a path even when two repositories hold an asset of the same name
+                safe_filename = asset_name.translate(self.safe_filename_table)
+                local_path = os.path.join(self.temp_dir, f"asset-{next(self._asset_dir_counter)}", safe_filename)
+                
+                self.logger.debug(f"    Download URL: {download_url}")
+                self.logger.debug(f"    Local path: {local_path}")
+                
+                yield {
+                    'asset': asset,
+                    'asset_name': asset_name,
+                    'download_url': download_url,
+                    'local_path': local_path,
+                    'repo_name': repo_name,
+                    'component_name': component_name,
+                    'artifact_type': artifact_type,
+                    'strategy': strategy,
+                    'vuln_metadata': vuln_metadata,
+                    'checksum_key': checksum_key,
+                    'scan_timestamp': scan_timestamp
+                }
+    
+    def reuse_cached_scan(self, asset: Dict[str, Any], asset_info: dict, strategy: dict, vuln_metadata: dict,
+                          checksum_key: tuple, all_vulnerabilities: List[Dict[str, Any]]):
+        """Record results for an asset whose identical content was already scanned in this run."""
+        cached_vulnerabilities, cached_report_path = self.checksum_scan_cache[checksum_key]
+        vulnerabilities = [dict(vuln, **vuln_metadata) for vuln in cached_vulnerabilities]
+        self.stats['vulnerabilities_found'] += len(vulnerabilities)
+        self.stats['assets_deduplicated'] += 1
+        
+        self.logger.info(f"    SCAN RESULT: Found {len(vulnerabilities)} vulnerabilities (reused from identical content {checksum_key[0]})")
+        scan_details = {
+            'scan_strategy': f"{strategy['reason']} (reused result for identical checksum)",
+            'vulnerabilities_found': len(vulnerabilities),
+            'scan_type': strategy['scan_type'],
+            'file_size': asset.get('fileSize', 'Unknown'),
+            'scan_duration': '0:00:00',
+            'trivy_command': 'N/A (checksum cache hit)'
+        }
+        self.log_successful_scan(asset_info, scan_details)
+        
+        all_vulnerabilities.extend(vulnerabilities)
+        self.write_results(vulnerabilities)
+        
+        if cached_report_path:
+            # A report from this run may still be queued on the writer pool
+            pending_write = self.report_writes.get(cached_report_path)
+            if pending_write:
+                pending_write.result()
+            if os.path.exists(cached_report_path):
+                with open(cached_report_path, 'r', encoding='utf-8') as f:
+                    cached_html = f.read()
+                self.save_individual_html_report(cached_html, asset_info['component'], asset_info['asset'],
+                                                 asset_info['repository'], vuln_metadata['scan_timestamp'], len(vulnerabilities))
+    
+    def download_asset_timed(self, asset_url: str, local_path: str) -> tuple:
+        """Download an asset and return (success, elapsed_time_str). Runs on download worker threads."""
+        download_start = datetime.now()
+        success = self.download_asset(asset_url, local_path)
+        return success, str(datetime.now() - download_start)
+    
+    def run_scan_jobs(self, scan_jobs, all_vulnerabilities: List[Dict[str, Any]]):
+        """Download and scan jobs on background threads, recording results in job order on this thread."""
+        downloads = deque()
+        scans = deque()
+        
+        with ThreadPoolExecutor(max_workers=self.download_prefetch) as download_executor, \
+                ThreadPoolExecutor(max_workers=self.scan_workers, thread_name_prefix='trivy-scan') as scan_executor:
+            for job in scan_jobs:
+                future = download_executor.submit(self.download_asset_timed, job['download_url'], job['local_path'])
+                downloads.append((job, future))
+                
+                # Keep at most download_prefetch downloads in flight ahead of the scans
+                if len(downloads) > self.download_prefetch:
+                    current_job, current_future = downloads.popleft()
+                    scans.append((current_job, scan_executor.submit(self.scan_downloaded_asset, current_job, current_future.result())))
+                
+                # Keep at most scan_workers scans pending; the oldest is recorded first to preserve order
+                if len(scans) >= self.scan_workers:
+                    current_job, current_future = scans.popleft()
+                    self.scan_asset_job(current_job, current_future.result(), all_vulnerabilities)
+            
+            while downloads:
+                current_job, current_future = downloads.popleft()
+                scans.append((current_job, scan_executor.submit(self.scan_downloaded_asset, current_job, current_future.result())))
+            
+            while scans:
+                current_job, current_future = scans.popleft()
+                self.scan_asset_job(current_job, current_future.result(), all_vulnerabilities)
+    
+    def scan_downloaded_asset(self, job: dict, download_result: tuple) -> tuple:
+        """Run Trivy on one downloaded asset. Runs on scan worker threads; returns (download_result, scan_results, scan_duration)."""
+        downloaded, _ = download_result
+        checksum_key = job['checksum_key']
+        
+        # Failed downloads and content already scanned elsewhere are handled when the job is recorded
+        if not downloaded or (checksum_key and checksum_key in self.checksum_scan_cache):
+            return download_result, None, None
+        
+        scan_start_time = datetime.now()
+        scan_results = self.scan_with_strategy(job['local_path'], job['strategy'], job['artifact_type'])
+        return download_result, scan_results, str(datetime.now() - scan_start_time)
+    
+    def scan_asset_job(self, job: dict, scan_outcome: tuple, all_vulnerabilities: List[Dict[str, Any]]):
+        """Record the download and Trivy outcome of one asset."""
+        asset_name = job['asset_name']
+        local_path = job['local_path']
+        asset_dir = os.path.dirname(local_path)
+        strategy = job['strategy']
+        artifact_type = job['artifact_type']
+        checksum_key = job['checksum_key']
+        (downloaded, download_time), scan_results, scan_duration = scan_outcome
+        
+        asset_info = {
+            'repository': job['repo_name'],
+            'component': job['component_name'],
+            'asset': asset_name,
+            'artifact_type': artifact_type
+        }
         
-        # Save results
-        self.save_results(all_vulnerabilities, scan_timestamp)
-        self.generate_combined_report(all_vulnerabilities, scan_timestamp)
-        self.save_scan_issues_report(scan_timestamp)  # Save separate issues report
+        if not downloaded:
+            self.logger.error(f"    DOWNLOAD FAILED: Could not download {asset_name}")
+            # Log download error
+            self.log_scan_issue('error', asset_info, 'Asset download failed', f"URL: {job['download_url']}")
+            
+            # Clean up downloaded file
+            self.schedule_cleanup(asset_dir)
+            return
         
-        # Clean up temporary individual reports if retention is disabled
-        if not self.retain_individual_reports:
-            self.cleanup_temporary_reports()
+        file_size = os.path.getsize(local_path) if os.path.exists(local_path) else 0
+        self.logger.info(f"    Downloaded {asset_name} in {download_time} (size: {file_size:,} bytes)")
         
-        # Always clean up downloaded temp files (but preserve individual reports if configured)
-        self.cleanup_downloaded_files()
+        # Identical content may have been scanned while this asset was in flight
+        if checksum_key and checksum_key in self.checksum_scan_cache:
+            self.reuse_cached_scan(job['asset'], asset_info, strategy, job['vuln_metadata'], checksum_key, all_vulnerabilities)
+            self.schedule_cleanup(asset_dir)
+            return
+        
+        self.logger.info(f"    Scan completed in {scan_duration}")
+        
+        if scan_results and scan_results[0]:  # Check JSON results
+            json_data, html_content = scan_results
+            vulnerabilities = self.extract_vulnerabilities(json_data)
+            vuln_count = len(vulnerabilities)
+            self.stats['vulnerabilities_found'] += vuln_count
             
-        self.print_summary()
+            self.logger.info(f"    SCAN RESULT: Found {vuln_count} vulnerabilities")
+            
+            if vuln_count > 0:
+                # Log vulnerability summary by severity
+                severity_counts = Counter(vuln.get('severity', 'UNKNOWN') for vuln in vulnerabilities)
+                
+                severity_summary = ", ".join([f"{severity}: {count}" for severity, count in severity_counts.items()])
+                self.logger.info(f"    Vulnerability breakdown: {severity_summary}")
+            
+            # Log successful scan with details
+            scan_details = {
+                'scan_strategy': strategy['reason'],
+                'vulnerabilities_found': len(vulnerabilities),
+                'scan_type': strategy['scan_type'],
+                'file_size': f"{file_size:,} bytes",
+                'scan_duration': scan_duration,
+                'trivy_command': f"trivy {strategy['scan_type']}"
+            }
+            self.log_successful_scan(asset_info, scan_details)
+            
+            # Add metadata to each vulnerability
+            for vuln in vulnerabilities:
+                vuln.update(job['vuln_metadata'])
+            
+            all_vulnerabilities.extend(vulnerabilities)
+            self.write_results(vulnerabilities)
+            
+            # Save individual HTML report for all successful scans
+            report_path = None
+            if html_content:
+                report_path = self.save_individual_html_report(html_content, job['component_name'], asset_name, job['repo_name'], job['scan_timestamp'], len(vulnerabilities))
+            
+            # Remember result so identical content elsewhere is not downloaded/scanned again
+            if checksum_key:
+                self.checksum_scan_cache[checksum_key] = (vulnerabilities, report_path)
+                self.store_cached_scan(checksum_key, vulnerabilities, html_content)
+            
+            # Hand downloaded file to the background janitor to free up space
+            self.schedule_cleanup(asset_dir)
+            
+            if vulnerabilities:
+                self.logger.info(f"Found {len(vulnerabilities)} vulnerabilities in {asset_name}")
+        else:
+            self.logger.warning(f"    SCAN FAILED: Trivy scan returned no results")
+            # Log scan error with detailed information
+            self.log_scan_issue('error', asset_info, 'Trivy scan failed - no results returned', f"Strategy: {strategy['reason']}, Path: {local_path}")
+            self.stats['scan_errors'] += 1
+            
+            # Delete downloaded file even if scan failed to free up space
+            self.schedule_cleanup(asset_dir)
+    
+    def open_results_stream(self, timestamp: str, file_stamp: str):
+        """Open the scan result files so vulnerabilities can be written as each asset completes."""
+        self.results_json_file = os.path.join(self.output_dir, f'nexus_scan_results_{file_stamp}.json')
+        self.results_csv_file = os.path.join(self.output_dir, f'nexus_scan_results_{file_stamp}.csv')
+        
+        # JSON document is written incrementally: header now, one vulnerability per line, footer in save_results.
+        # The file is binary so orjson output goes straight to disk without a decode/encode round trip.
+        self._results_json = open(self.results_json_file, 'wb')
+        self._results_json.write(('{"scan_timestamp": ' + json.dumps(timestamp) + ',\n"vulnerabilities": [\n').encode('utf-8'))
+        self._results_written = 0
+        
+        # CSV file is created lazily on the first vulnerability (no empty CSV for clean scans)
+        self._results_csv = None
+        self._results_csv_writer = None
+    
+    def write_results(self, vulnerabilities: List[Dict[str, Any]]):
+        """Append vulnerabilities to the streamed JSON and CSV result files."""
+        if not vulnerabilities:
+            return
         
-        # Move all reports to timestamped folder
-        self.move_reports_to_timestamped_folder(scan_timestamp)
-    
-    def save_results(self, vulnerabilities: List[Dict[str, Any]], timestamp: str):
-        """Save scan results to files."""
-        # JSON output
-        json_file = os.path.join(self.output_dir, f'nexus_scan_results_{timestamp.replace(":", "-")}.json')
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                'scan_timestamp': timestamp,
-                'statistics': self.stats,
-                'vulnerabilities': vulnerabilities
-            }, f, indent=2, ensure_ascii=False)
-        
-        # CSV output
-        csv_file = os.path.join(self.output_dir, f'nexus_scan_results_{timestamp.replace(":", "-")}.csv')
-        if vulnerabilities:
-            fieldnames = vulnerabilities[0].keys()
-            with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(vulnerabilities)
+        if orjson is not None:
+            encoded = [orjson.dumps(vuln) for vuln in vulnerabilities]
+        else:
+            encoded = [json.dumps(vuln, ensure_ascii=False, separators=(',', ':')).encode('utf-8') for vuln in vulnerabilities]
+        if self._results_written:
+            self._results_json.write(b',\n')
+        self._results_json.write(b',\n'.join(encoded))
+        self._results_written += len(encoded)
+        
+        if self._results_csv_writer is None:
+            self._results_csv = open(self.results_csv_file, 'w', newline='', encoding='utf-8')
+            self._results_csv_writer = csv.DictWriter(self._results_csv, fieldnames=list(vulnerabilities[0].keys()),
+                                                      extrasaction='ignore')
+            self._results_csv_writer.writeheader()
+        self._results_csv_writer.writerows(vulnerabilities)
+        
+        # Hand each asset's rows to the OS so an interrupted scan keeps everything found so far
+        self._results_json.flush()
+        self._results_csv.flush()
+    
+    def save_results(self, timestamp: str):
+        """Finalize the streamed scan result files."""
+        # Statistics are only final once scanning is done, so they close the JSON document
+        self._results_json.write(('\n],\n"statistics": ' + json.dumps(self.stats) + '}\n').encode('utf-8'))
+        self._results_json.close()
+        
+        if self._results_csv is not None:
+            self._results_csv.close()
         
         self.logger.info(f"Results saved to:")
-        self.logger.info(f"  JSON: {json_file}")
-        self.logger.info(f"  CSV: {csv_file}")
+        self.logger.info(f"  JSON: {self.results_json_file} ({self._results_written} vulnerabilities)")
+        self.logger.info(f"  CSV: {self.results_csv_file}")
     
     def detect_artifact_type(self, asset_name: str, repo_format: str) -> str:
         """Intelligently detect artifact type based on file extension and repository format."""
@@ -1692,65 +2264,33 @@ class CleanNexusScanner:
                 return 'node_package'
             else:
                 return 'node_package'  # Default for npm repos
-        
-        # Hash/checksum files should be detected first
-        if any(asset_lower.endswith(ext) for ext in ['.md5', '.sha1', '.sha256', '.sha512']):
-            return 'script'  # These are treated as script files for consistency
-        
-        # Specific file extension patterns (in priority order)
-        # Java artifacts
-        if any(asset_lower.endswith(ext) for ext in ['.jar', '.war', '.ear']):
-            return 'java_jar'
-        elif any(asset_lower.endswith(ext) for ext in ['.java', '.class']):
-            return 'java_source'
-        elif 'pom.xml' in asset_lower or asset_lower.endswith('.pom'):
-            return 'maven_pom'
-        
-        # Python packages (check before generic archives)
-        if any(asset_lower.endswith(ext) for ext in ['.whl', '.egg']) or (asset_lower.endswith('.tar.gz') and 'python' in asset_lower):
-            return 'python_package'
-        
-        # NuGet packages
-        if any(asset_lower.endswith(ext) for ext in ['.nupkg', '.nuspec']):
-            return 'nuget_package'
-        
-        # Node packages - enhanced detection to match successful test script logic
-        if ('package.json' in asset_lower or 
-            asset_lower.endswith('.npm') or 
-            (asset_lower.endswith('.tgz') and ('node' in asset_lower or 'client' in asset_lower or 'npm' in asset_lower)) or
-            asset_lower.endswith('.tar.gz')):
-            return 'node_package'
-        
-        # Container images (only for actual Docker layers/manifests, not in Maven repos)
-        if repo_format != 'docker' and any(filename in asset_lower for filename in ['manifest.json', 'config.json']):
-            return 'docker_manifest'
-        
-        # Archives (generic)
-        if any(asset_lower.endswith(ext) for ext in ['.zip', '.7z', '.rar']):
-            return 'archive'
-        elif any(asset_lower.endswith(ext) for ext in ['.tar', '.tar.gz', '.tgz']) and repo_format != 'docker':
-            return 'archive'  # Treat .tar.gz as archives unless in Docker repo
-        
-        # Binary executables
-        if any(asset_lower.endswith(ext) for ext in ['.exe', '.dll', '.so', '.dylib']):
-            return 'binary_executable'
-        
-        # Scripts
-        if any(asset_lower.endswith(ext) for ext in ['.sh', '.bat', '.ps1', '.py', '.js']):
-            return 'script'
-        
-        # Configuration files
-        if any(asset_lower.endswith(ext) for ext in ['.xml', '.json', '.yaml', '.yml', '.properties', '.conf']):
-            return 'configuration'
-        
-        # SBOM files
-        if any(filename in asset_lower for filename in ['.spdx']) or (asset_lower.endswith('.json') and 'sbom' in asset_lower):
-            return 'sbom'
-        
-        # Security reports
-        if any(filename in asset_lower for filename in ['trivy-report', 'scan-report', '.sarif']):
-            return 'security_report'
-        
+
+        # Best (lowest rank) match across suffix and substring rules
+        best_rank = len(self.artifact_detection_rules)
+        best_type = None
+
+        # Suffix rules: last extension plus any compound suffix such as '.tar.gz'
+        dot_index = asset_lower.rfind('.')
+        candidate_suffixes = [asset_lower[dot_index:]] if dot_index >= 0 else []
+        candidate_suffixes.extend(s for s in self._compound_suffixes if asset_lower.endswith(s))
+
+        for suffix in candidate_suffixes:
+            for rank, artifact_type, keywords in self._suffix_map.get(suffix, ()):
+                if rank >= best_rank:
+                    break
+                if not keywords or any(keyword in asset_lower for keyword in keywords):
+                    best_rank, best_type = rank, artifact_type
+                    break
+
+        # Substring rules (e.g. pom.xml, package.json, trivy-report)
+        for match in self._substring_re.finditer(asset_lower):
+            rank, artifact_type = self._substring_ranks[match.group()]
+            if rank < best_rank:
+                best_rank, best_type = rank, artifact_type
+
+        if best_type:
+            return best_type
+
         # Repository format-based fallback
         if repo_format == 'maven2':
             return 'maven_artifact'
@@ -1861,7 +2401,7 @@ class CleanNexusScanner:
     def scan_docker_components(self, component: Dict[str, Any], repo_name: str, scan_timestamp: str) -> List[Dict[str, Any]]:
         """Scan Docker components (container images) using Trivy's native image scanning."""
         vulnerabilities = []
-        component_name = component.get('name', 'unknown')
+        component_name = sys.intern(component.get('name') or 'unknown')
         component_version = component.get('version', 'unknown')
         
         try:
@@ -1887,7 +2427,7 @@ class CleanNexusScanner:
                 self.logger.info(f"Trying image reference: {image_ref}")
                 
                 # Try direct image scanning first
-                results = self.scan_docker_image_direct(image_ref, component_name, component_version)
+                results = self.scan_docker_image_direct(image_ref, component_name, component_version, repo_name)
                 if results:
                     # Process results and add metadata
                     for vuln in results:
@@ -1928,29 +2468,18 @@ class CleanNexusScanner:
         
         return vulnerabilities
     
-    def scan_docker_image_direct(self, image_reference: str, component_name: str, component_version: str) -> List[Dict[str, Any]]:
+    def scan_docker_image_direct(self, image_reference: str, component_name: str, component_version: str, repo_name: str) -> List[Dict[str, Any]]:
         """Scan Docker image directly using Trivy's image scanning capability."""
         try:
             self.logger.debug(f"=== Starting Docker image scan ===")
             self.logger.debug(f"Image reference: {image_reference}")
             self.logger.debug(f"Component: {component_name}:{component_version}")
             
-            # Create output files
-            safe_name = image_reference.replace('/', '_').replace(':', '_')
-            json_output_file = os.path.join(self.output_dir, 'temp', f"{safe_name}_docker.json")
-            html_output_file = os.path.join(self.output_dir, 'temp', f"{safe_name}_docker.html")
-            
-            os.makedirs(os.path.dirname(json_output_file), exist_ok=True)
-            self.logger.debug(f"Docker JSON output: {json_output_file}")
-            self.logger.debug(f"Docker HTML output: {html_output_file}")
-            
-            # JSON scan command
+            # Trivy streams both reports to stdout, so nothing is written to or cleaned from the temp directory
             json_cmd = [
                 self.trivy_path, "image",
                 "--format", "json",
-                "--output", json_output_file,
-                image_reference
-            ]
+            ] + self.get_trivy_cache_args("image") + [image_reference]
             
             # HTML scan command  
             html_template_path = os.path.join(os.path.dirname(self.trivy_path), 'contrib', 'html.tpl')
@@ -1963,9 +2492,7 @@ class CleanNexusScanner:
                 self.trivy_path, "image",
                 "--format", "template", 
                 "--template", f"@{html_template_path}",
-                "--output", html_output_file,
-                image_reference
-            ]
+            ] + self.get_trivy_cache_args("image") + [image_reference]
             
             # Add --quiet flag only if not in debug mode
             if not self.debug_mode:
@@ -1974,66 +2501,54 @@ class CleanNexusScanner:
             
             self.logger.debug(f"Docker JSON command: {' '.join(json_cmd)}")
             
-            # Run JSON scan
-            json_result = subprocess.run(json_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, 
-                                       universal_newlines=True, timeout=300)
+            # Run JSON scan; stdout stays as bytes so it is parsed without a text decoding pass
+            json_result = subprocess.run(json_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=300)
+            json_stderr = json_result.stderr.decode('utf-8', errors='replace')
             
             self.logger.debug(f"Docker JSON scan return code: {json_result.returncode}")
-            if json_result.stdout:
-                self.logger.debug(f"Docker JSON scan stdout: {json_result.stdout}")
-            if json_result.stderr:
-                self.logger.debug(f"Docker JSON scan stderr: {json_result.stderr}")
+            if json_stderr:
+                self.logger.debug(f"Docker JSON scan stderr: {json_stderr}")
                 
             if json_result.returncode != 0:
-                self.logger.debug(f"Docker image scan failed for {image_reference}: {json_result.stderr}")
+                self.logger.debug(f"Docker image scan failed for {image_reference}: {json_stderr}")
                 return []
             
-            self.logger.debug(f"Docker HTML command: {' '.join(html_cmd)}")
-            
-            # Run HTML scan
-            html_result = subprocess.run(html_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, 
-                                       universal_newlines=True, timeout=300)
-            
-            self.logger.debug(f"Docker HTML scan return code: {html_result.returncode}")
-            if html_result.stdout:
-                self.logger.debug(f"Docker HTML scan stdout: {html_result.stdout}")
-            if html_result.stderr:
-                self.logger.debug(f"Docker HTML scan stderr: {html_result.stderr}")
-            
-            # Parse JSON results
+            # Parse JSON results straight from the captured output
             vulnerabilities = []
-            if os.path.exists(json_output_file):
-                try:
-                    with open(json_output_file, 'r', encoding='utf-8') as f:
-                        json_content = f.read()
-                        self.logger.debug(f"Docker JSON file size: {len(json_content)} characters")
-                        if json_content.strip():
-                            json_data = json.loads(json_content)
-                            vulnerabilities = self.extract_vulnerabilities(json_data)
-                            self.logger.debug(f"Docker scan found {len(vulnerabilities)} vulnerabilities")
-                        else:
-                            self.logger.debug("Docker JSON file is empty")
-                except Exception as e:
-                    self.logger.error(f"Error parsing Docker JSON results: {e}")
+            self.logger.debug(f"Docker JSON output size: {len(json_result.stdout)} bytes")
+            try:
+                if json_result.stdout.strip():
+                    json_data = orjson.loads(json_result.stdout) if orjson is not None else json.loads(json_result.stdout)
+                    vulnerabilities = self.extract_vulnerabilities(json_data)
+                    self.logger.debug(f"Docker scan found {len(vulnerabilities)} vulnerabilities")
+                else:
+                    self.logger.debug("Docker JSON output is empty")
+            except Exception as e:
+                self.logger.error(f"Error parsing Docker JSON results: {e}")
+            
+            # The HTML report is only kept for images with vulnerabilities, so only render it for those
+            if vulnerabilities:
+                # Render from the JSON already captured instead of pulling and analysing the image a second time
+                html_result = None
+                if self.trivy_convert_supported:
+                    report_base = os.path.join(self.temp_dir, f"image-{next(self._asset_dir_counter)}")
+                    html_result = self.convert_trivy_report(json_result.stdout, report_base, html_template_path)
                 
-                # Save individual HTML report if vulnerabilities found and HTML exists
-                if vulnerabilities and os.path.exists(html_output_file):
+                if html_result is None:
+                    self.logger.debug(f"Docker HTML command: {' '.join(html_cmd)}")
+                    html_result = subprocess.run(html_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=300)
+                
+                html_content = html_result.stdout.decode('utf-8', errors='replace')
+                self.logger.debug(f"Docker HTML scan return code: {html_result.returncode}")
+                if html_result.stderr:
+                    self.logger.debug(f"Docker HTML scan stderr: {html_result.stderr.decode('utf-8', errors='replace')}")
+                
+                if html_result.returncode == 0 and html_content:
                     try:
-                        with open(html_output_file, 'r', encoding='utf-8') as f:
-                            html_content = f.read()
                         self.save_individual_html_report(html_content, component_name, f"docker_image_{component_version}", repo_name, "docker_scan", len(vulnerabilities))
                         self.logger.debug("Docker HTML report saved")
                     except Exception as e:
                         self.logger.error(f"Error saving Docker HTML report: {e}")
-                
-                # Clean up temp files
-                for temp_file in [json_output_file, html_output_file]:
-                    if os.path.exists(temp_file):
-                        try:
-                            os.remove(temp_file)
-                            self.logger.debug(f"Cleaned up temp file: {temp_file}")
-                        except Exception as e:
-                            self.logger.debug(f"Could not clean up temp file {temp_file}: {e}")
                             
             self.logger.debug(f"=== Docker image scan completed ===")
             return vulnerabilities
@@ -2047,12 +2562,12 @@ class CleanNexusScanner:
             return []
     
     def save_individual_html_report(self, html_content: str, component_name: str, asset_name: str, repository_name: str, timestamp: str, vulnerability_count: int = 0):
-        """Save individual HTML report for assets, organizing by vulnerability status."""
+        """Save individual HTML report for assets, organizing by vulnerability status. Returns the report path."""
         try:
-            # Create safe filename
-            safe_component = component_name.replace('/', '_').replace(':', '_')
-            safe_asset = asset_name.replace('/', '_').replace('\\', '_')
-            safe_repository = repository_name.replace('/', '_').replace(':', '_')
+            # Create safe filenames with one translate pass per name
+            safe_component = component_name.translate(self.safe_filename_table)
+            safe_asset = asset_name.translate(self.safe_filename_table)
+            safe_repository = repository_name.translate(self.safe_filename_table)
             
             if self.retain_individual_reports:
                 # Create repository-wise directory structure with vulnerability status
@@ -2073,8 +2588,7 @@ class CleanNexusScanner:
                 filename = f"{safe_component}_{safe_asset}_report.html"
                 html_file = os.path.join(base_dir, filename)
                 
-                with open(html_file, 'w', encoding='utf-8') as f:
-                    f.write(html_content)
+                self.report_writes[html_file] = self.report_write_pool.submit(self._write_report_file, html_file, html_content)
                 
                 self.report_stats['total_reports_saved'] += 1
                 self.logger.info(f"Individual HTML report retained: {html_file} {status_info}")
@@ -2086,13 +2600,29 @@ class CleanNexusScanner:
                     f'individual_report_{safe_component}_{safe_asset}_{timestamp.replace(":", "-")}.html'
                 )
                 
-                with open(html_file, 'w', encoding='utf-8') as f:
-                    f.write(html_content)
+                self.report_writes[html_file] = self.report_write_pool.submit(self._write_report_file, html_file, html_content)
                 
                 self.logger.debug(f"Temporary individual HTML report saved: {html_file}")
             
+            return html_file
+            
         except Exception as e:
             self.logger.error(f"Error saving individual HTML report: {e}")
+            return None
+    
+    def _write_report_file(self, html_file: str, html_content: str):
+        """Write one individual report file with a single raw write. Runs on the report writer pool."""
+        try:
+            # Encode once and hand the whole document to the kernel, bypassing the text and buffer layers
+            remaining = memoryview(html_content.encode('utf-8'))
+            fd = os.open(html_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+            try:
+                while remaining:
+                    remaining = remaining[os.write(fd, remaining):]
+            finally:
+                os.close(fd)
+        except Exception as e:
+            self.logger.error(f"Error writing individual HTML report {html_file}: {e}")
     
     def cleanup_temporary_reports(self):
         """Clean up temporary individual HTML reports when retention is disabled."""
@@ -2148,275 +2678,158 @@ class CleanNexusScanner:
         except Exception as e:
             self.logger.error(f"Error during downloaded files cleanup: {e}")
     
-    def generate_html_reports(self, vulnerabilities: List[Dict[str, Any]], timestamp: str):
-        """Generate HTML reports for vulnerabilities."""
-        html_file = os.path.join(self.output_dir, f'nexus_scan_report_{timestamp.replace(":", "-")}.html')
+    def aggregate_vulnerabilities(self, vulnerabilities: List[Dict[str, Any]]) -> dict:
+        """Compute every report aggregate in a single pass over the vulnerabilities."""
+        repo_data = defaultdict(lambda: defaultdict(list))
+        severities = []
+        repo_severities = defaultdict(list)
+        repo_components = defaultdict(set)
+        key_fields = itemgetter('severity', 'repository', 'component')
         
-        # Group vulnerabilities by repository and component
-        repo_data = {}
         for vuln in vulnerabilities:
-            repo = vuln.get('repository', 'Unknown')
-            component = vuln.get('component', 'Unknown')
-            
-            if repo not in repo_data:
-                repo_data[repo] = {}
-            if component not in repo_data[repo]:
-                repo_data[repo][component] = []
+            try:
+                severity, repo, component = key_fields(vuln)
+            except KeyError:
+                severity = vuln.get('severity', 'UNKNOWN')
+                repo = vuln.get('repository', 'Unknown')
+                component = vuln.get('component', 'Unknown')
             
             repo_data[repo][component].append(vuln)
+            severities.append(severity)
+            repo_severities[repo].append(severity)
+            repo_components[repo].add(component)
+        
+        # Severity tallies are built by Counter in C from the collected columns rather than per-row increments
+        repo_summary = {}
+        for repo, repo_severity_list in repo_severities.items():
+            # Convert sets to lists for JSON serialization
+            components = list(repo_components[repo])
+            repo_summary[repo] = {
+                'total_vulnerabilities': len(repo_severity_list),
+                'components_with_vulnerabilities': components,
+                'severity_breakdown': Counter(repo_severity_list),
+                'unique_components_with_vulns': len(components)
+            }
+        
+        return {
+            'repo_data': repo_data,
+            'severity_counts': Counter(severities),
+            'repo_summary': repo_summary,
+            'affected_components': len(set().union(*repo_components.values()))
+        }
+    
+    def intern_vulnerability_advisories(self, vulnerabilities: List[Dict[str, Any]]) -> tuple:
+        """Store each distinct advisory text once and point vulnerability records at it by index."""
+        advisory_ids = {}
+        advisories = []
+        records = []
+        
+        for vuln in vulnerabilities:
+            references = vuln.get('references') or []
+            key = (vuln.get('vulnerability_id', ''), vuln.get('title', ''), vuln.get('description', ''), tuple(references))
+            advisory_id = advisory_ids.get(key)
+            if advisory_id is None:
+                advisory_id = advisory_ids[key] = len(advisories)
+                advisories.append({
+                    'vulnerability_id': key[0],
+                    'title': key[1],
+                    'description': key[2],
+                    'references': references
+                })
+            
+            record = {field: value for field, value in vuln.items() if field not in ('title', 'description', 'references')}
+            record['advisory_id'] = advisory_id
+            records.append(record)
         
-        # Generate HTML content
-        html_content = self._generate_html_content(repo_data, timestamp)
+        self.logger.debug(f"Interned {len(records)} vulnerability records into {len(advisories)} unique advisories")
+        return advisories, records
+    
+    def generate_html_reports(self, vulnerabilities: List[Dict[str, Any]], timestamp: str, file_stamp: str, aggregates: dict = None):
+        """Generate HTML reports for vulnerabilities. Pass aggregates to reuse an existing aggregation pass."""
+        html_file = os.path.join(self.output_dir, f'nexus_scan_report_{file_stamp}.html')
+        self.write_report_stylesheet('scan_report.css')
+        
+        if not vulnerabilities or self.stats['vulnerabilities_found'] == 0:
+            # Healthy scan: the body is a static constant, no grouping or per-finding rendering needed
+            with open(html_file, 'w', encoding='utf-8') as f:
+                f.write(SCAN_REPORT_HEADER.substitute(self.stats, timestamp=timestamp, nexus_url=html.escape(self.nexus_url)))
+                f.write(SCAN_REPORT_EMPTY_BODY)
+            self.logger.info(f"  HTML: {html_file}")
+            return
         
-        with open(html_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        if aggregates is None:
+            aggregates = self.aggregate_vulnerabilities(vulnerabilities)
+        
+        # Stream HTML content straight into the file
+        with open(html_file, 'w', encoding='utf-8', buffering=self.report_write_buffer) as f:
+            f.writelines(self._iter_html_content(aggregates['repo_data'], timestamp))
         
         self.logger.info(f"  HTML: {html_file}")
     
-    def _generate_html_content(self, repo_data: Dict, timestamp: str) -> str:
-        """Generate HTML content for the vulnerability report."""
-        html = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Nexus Vulnerability Scan Report</title>
-    <style>
-        body {{
-            font-family: Arial, sans-serif;
-            margin: 20px;
-            background-color: #f5f5f5;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background-color: white;
-            padding: 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        .header {{
-            background-color: #2c3e50;
-            color: white;
-            padding: 20px;
-            border-radius: 8px;
-            margin-bottom: 20px;
-        }}
-        .summary {{
-            background-color: #ecf0f1;
-            padding: 15px;
-            border-radius: 5px;
-            margin-bottom: 20px;
-        }}
-        .repository {{
-            border: 1px solid #bdc3c7;
-            border-radius: 5px;
-            margin-bottom: 20px;
-            overflow: hidden;
-        }}
-        .repo-header {{
-            background-color: #3498db;
-            color: white;
-            padding: 15px;
-            font-weight: bold;
-            font-size: 18px;
-        }}
-        .component {{
-            border-bottom: 1px solid #ecf0f1;
-            padding: 10px;
-        }}
-        .component-name {{
-            font-weight: bold;
-            color: #2c3e50;
-            margin-bottom: 10px;
-        }}
-        .vulnerability {{
-            background-color: #fff;
-            border-left: 4px solid #e74c3c;
-            padding: 10px;
-            margin: 5px 0;
-        }}
-        .vulnerability.HIGH {{
-            border-left-color: #e74c3c;
-        }}
-        .vulnerability.MEDIUM {{
-            border-left-color: #f39c12;
-        }}
-        .vulnerability.LOW {{
-            border-left-color: #f1c40f;
-        }}
-        .vulnerability.CRITICAL {{
-            border-left-color: #8e44ad;
-        }}
-        .vuln-id {{
-            font-weight: bold;
-            color: #e74c3c;
-        }}
-        .severity {{
-            display: inline-block;
-            padding: 2px 8px;
-            border-radius: 3px;
-            color: white;
-            font-size: 12px;
-            font-weight: bold;
-        }}
-        .severity.CRITICAL {{
-            background-color: #8e44ad;
-        }}
-        .severity.HIGH {{
-            background-color: #e74c3c;
-        }}
-        .severity.MEDIUM {{
-            background-color: #f39c12;
-        }}
-        .severity.LOW {{
-            background-color: #f1c40f;
-            color: #333;
-        }}
-        .severity.UNKNOWN {{
-            background-color: #95a5a6;
-        }}
-        .no-vulnerabilities {{
-            background-color: #d5f4e6;
-            color: #27ae60;
-            padding: 20px;
-            border-radius: 5px;
-            text-align: center;
-            margin: 20px 0;
-        }}
-        .stats {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 15px;
-            margin: 20px 0;
-        }}
-        .stat-box {{
-            background-color: #f8f9fa;
-            padding: 15px;
-            border-radius: 5px;
-            text-align: center;
-            border: 1px solid #dee2e6;
-        }}
-        .stat-number {{
-            font-size: 24px;
-            font-weight: bold;
-            color: #2c3e50;
-        }}
-        .stat-label {{
-            color: #6c757d;
-            font-size: 14px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>Nexus Repository Vulnerability Scan Report</h1>
-            <p>Generated on: {timestamp}</p>
-            <p>Nexus Server: {self.nexus_url}</p>
-        </div>
+    def escape_html_fields(self, record: Dict[str, Any], defaults: Dict[str, str]) -> Dict[str, str]:
+        """HTML-escape every string field of a record in one pass so report markup cannot be broken by scan data.
         
-        <div class="summary">
-            <h2>Scan Summary</h2>
-            <div class="stats">
-                <div class="stat-box">
-                    <div class="stat-number">{self.stats['repositories_scanned']}</div>
-                    <div class="stat-label">Repositories Scanned</div>
-                </div>
-                <div class="stat-box">
-                    <div class="stat-number">{self.stats['components_found']}</div>
-                    <div class="stat-label">Components Found</div>
-                </div>
-                <div class="stat-box">
-                    <div class="stat-number">{self.stats['assets_scanned']}</div>
-                    <div class="stat-label">Assets Scanned</div>
-                </div>
-                <div class="stat-box">
-                    <div class="stat-number">{self.stats['vulnerabilities_found']}</div>
-                    <div class="stat-label">Vulnerabilities Found</div>
-                </div>
-            </div>
-        </div>
-"""
+        Missing fields are filled from defaults, so the result can be passed straight to str.format_map.
+        """
+        return {**defaults, **{field: html.escape(value) for field, value in record.items() if isinstance(value, str)}}
+    
+    def _iter_html_content(self, repo_data: Dict, timestamp: str) -> Iterator[str]:
+        """Yield the HTML content of the vulnerability report fragment by fragment."""
+        yield SCAN_REPORT_HEADER.substitute(self.stats, timestamp=timestamp, nexus_url=html.escape(self.nexus_url))
 
         if not repo_data or self.stats['vulnerabilities_found'] == 0:
-            html += """
-        <div class="no-vulnerabilities">
-            <h2>No Vulnerabilities Found</h2>
-            <p>Great news! No security vulnerabilities were detected in any of the scanned repositories.</p>
-        </div>
-"""
+            yield SCAN_REPORT_NO_VULNERABILITIES
         else:
-            html += "<h2>Vulnerability Details</h2>"
+            yield "<h2>Vulnerability Details</h2>"
+            # Bind the per-vulnerability callables once; the inner loop runs for every finding
+            escape_fields = self.escape_html_fields
+            severity_class = SCAN_REPORT_SEVERITY_CLASSES.get
+            render_vulnerability = SCAN_REPORT_VULNERABILITY.format_map
+            render_repeated_vulnerability = SCAN_REPORT_REPEATED_VULNERABILITY.format_map
             
             for repo_name, components in repo_data.items():
-                html += f"""
-        <div class="repository">
-            <div class="repo-header">Repository: {repo_name}</div>
-"""
+                yield SCAN_REPORT_REPOSITORY_HEADER.format(html.escape(repo_name))
                 
                 for component_name, vulns in components.items():
-                    html += f"""
-            <div class="component">
-                <div class="component-name">Component: {component_name}</div>
-"""
+                    yield SCAN_REPORT_COMPONENT_HEADER.format(html.escape(component_name))
                     
+                    # One card per distinct finding; repeats across the component's assets are folded into it
+                    findings = {}
                     for vuln in vulns:
-                        severity = vuln.get('severity', 'UNKNOWN')
-                        html += f"""
-                <div class="vulnerability {severity}">
-                    <div class="vuln-id">{vuln.get('vulnerability_id', 'N/A')}</div>
-                    <span class="severity {severity}">{severity}</span>
-                    <h4>{vuln.get('title', 'No title available')}</h4>
-                    <p><strong>Package:</strong> {vuln.get('pkg_name', 'N/A')} ({vuln.get('pkg_version', 'N/A')})</p>
-                    <p><strong>Description:</strong> {vuln.get('description', 'No description available')}</p>
-                    <p><strong>Fixed Version:</strong> {vuln.get('fixed_version', 'Not available')}</p>
-                    <p><strong>Asset:</strong> {vuln.get('asset', 'N/A')}</p>
-                </div>
-"""
+                        key = (vuln.get('vulnerability_id'), vuln.get('pkg_name'), vuln.get('pkg_version'))
+                        findings.setdefault(key, []).append(vuln)
+                    
+                    for occurrences in findings.values():
+                        fields = escape_fields(occurrences[0], SCAN_REPORT_VULNERABILITY_DEFAULTS)
+                        fields['severity_class'] = severity_class(fields['severity'], 'UNKNOWN')
+                        if len(occurrences) == 1:
+                            yield render_vulnerability(fields)
+                            continue
+                        
+                        assets = dict.fromkeys(str(vuln.get('asset', 'N/A')) for vuln in occurrences)
+                        fields['occurrences'] = len(occurrences)
+                        fields['asset_count'] = len(assets)
+                        fields['asset_items'] = "\n".join(SCAN_REPORT_ASSET_ITEM.format(html.escape(asset)) for asset in assets)
+                        yield render_repeated_vulnerability(fields)
                     
-                    html += "            </div>"
+                    yield "            </div>"
                 
-                html += "        </div>"
+                yield "        </div>"
 
-        html += """
-    </div>
-</body>
-</html>
-"""
-        return html
+        yield REPORT_FOOTER
     
-    def generate_combined_report(self, vulnerabilities: List[Dict[str, Any]], timestamp: str):
-        """Generate comprehensive combined reports in JSON and HTML."""
+    def generate_combined_report(self, vulnerabilities: List[Dict[str, Any]], timestamp: str, file_stamp: str, aggregates: dict = None):
+        """Generate comprehensive combined reports in JSON and HTML. Pass aggregates to reuse an existing aggregation pass."""
         # Enhanced JSON report with additional metadata
-        combined_json_file = os.path.join(self.output_dir, f'comprehensive_scan_report_{timestamp.replace(":", "-")}.json')
-        
-        # Group vulnerabilities by severity
-        severity_counts = {}
-        repo_summary = {}
+        combined_json_file = os.path.join(self.output_dir, f'comprehensive_scan_report_{file_stamp}.json')
         
-        for vuln in vulnerabilities:
-            severity = vuln.get('severity', 'UNKNOWN')
-            repo = vuln.get('repository', 'Unknown')
-            
-            severity_counts[severity] = severity_counts.get(severity, 0) + 1
-            
-            if repo not in repo_summary:
-                repo_summary[repo] = {
-                    'total_vulnerabilities': 0,
-                    'components_with_vulnerabilities': set(),
-                    'severity_breakdown': {}
-                }
-            
-            repo_summary[repo]['total_vulnerabilities'] += 1
-            repo_summary[repo]['components_with_vulnerabilities'].add(vuln.get('component', 'Unknown'))
-            repo_summary[repo]['severity_breakdown'][severity] = repo_summary[repo]['severity_breakdown'].get(severity, 0) + 1
+        if aggregates is None:
+            aggregates = self.aggregate_vulnerabilities(vulnerabilities)
+        severity_counts = aggregates['severity_counts']
+        repo_summary = aggregates['repo_summary']
         
-        # Convert sets to lists for JSON serialization
-        for repo in repo_summary:
-            repo_summary[repo]['components_with_vulnerabilities'] = list(repo_summary[repo]['components_with_vulnerabilities'])
-            repo_summary[repo]['unique_components_with_vulns'] = len(repo_summary[repo]['components_with_vulnerabilities'])
+        # The same CVE text repeats across many assets; keep one copy and reference it by advisory_id
+        advisories, vulnerability_records = self.intern_vulnerability_advisories(vulnerabilities)
         
         comprehensive_data = {
             'scan_metadata': {
@@ -2432,7 +2845,8 @@ class CleanNexusScanner:
                 'severity_breakdown': severity_counts,
                 'repository_summary': repo_summary
             },
-            'detailed_vulnerabilities': vulnerabilities,
+            'vulnerability_advisories': advisories,
+            'detailed_vulnerabilities': vulnerability_records,
             'scan_configuration': {
                 'repositories_scanned': self.stats['repositories_scanned'],
                 'scan_types': ['filesystem', 'archive'],
@@ -2440,297 +2854,150 @@ class CleanNexusScanner:
             }
         }
         
-        with open(combined_json_file, 'w', encoding='utf-8') as f:
-            json.dump(comprehensive_data, f, indent=2, ensure_ascii=False)
+        # Per-finding records go to an ND-JSON sidecar (one compact record per line) so the report JSON
+        # stays small and consumers can stream the findings without loading one giant document
+        records_file = os.path.join(self.output_dir, f'comprehensive_scan_vulnerabilities_{file_stamp}.jsonl')
+        self.write_vulnerability_records(records_file, vulnerability_records)
+        report_data = {**comprehensive_data, 'detailed_vulnerabilities': {
+            'format': 'ndjson',
+            'file': os.path.basename(records_file),
+            'count': len(vulnerability_records)
+        }}
         
-        # Enhanced HTML report
-        combined_html_file = os.path.join(self.output_dir, f'comprehensive_scan_report_{timestamp.replace(":", "-")}.html')
-        comprehensive_html = self._generate_comprehensive_html(comprehensive_data, timestamp)
+        if orjson is not None:
+            with open(combined_json_file, 'wb') as f:
+                f.write(orjson.dumps(report_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            # json.dump encodes incrementally, so a large write buffer keeps the chunk writes cheap
+            with open(combined_json_file, 'w', encoding='utf-8', buffering=self.report_write_buffer) as f:
+                json.dump(report_data, f, indent=2, ensure_ascii=False)
         
-        with open(combined_html_file, 'w', encoding='utf-8') as f:
-            f.write(comprehensive_html)
+        # Enhanced HTML report
+        combined_html_file = os.path.join(self.output_dir, f'comprehensive_scan_report_{file_stamp}.html')
+        if self.compress_reports:
+            # The repeated row markup compresses very well; gzip.open streams it through the same writes
+            combined_html_file += '.gz'
+        self.write_report_stylesheet('comprehensive_report.css')
+        self.write_comprehensive_html(combined_html_file, comprehensive_data, timestamp, aggregates['affected_components'])
         
         self.logger.info(f"Comprehensive reports generated:")
         self.logger.info(f"  JSON: {combined_json_file}")
+        self.logger.info(f"  Vulnerabilities (ND-JSON): {records_file}")
         self.logger.info(f"  HTML: {combined_html_file}")
     
-    def _generate_comprehensive_html(self, data: Dict, timestamp: str) -> str:
-        """Generate comprehensive HTML report with enhanced analytics."""
+    def write_vulnerability_records(self, records_file: str, records: List[Dict[str, Any]]):
+        """Write vulnerability records as ND-JSON, one compact JSON object per line."""
+        if orjson is not None:
+            with open(records_file, 'wb', buffering=self.report_write_buffer) as f:
+                for record in records:
+                    f.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+        else:
+            with open(records_file, 'w', encoding='utf-8', buffering=self.report_write_buffer) as f:
+                for record in records:
+                    f.write(json.dumps(record, ensure_ascii=False))
+                    f.write('\n')
+    
+    def write_report_stylesheet(self, filename: str):
+        """Write a report's linked stylesheet into the output directory unless an identical copy is already there."""
+        css = REPORT_STYLESHEETS[filename]
+        css_file = os.path.join(self.output_dir, filename)
+        try:
+            with open(css_file, 'r', encoding='utf-8') as f:
+                if f.read() == css:
+                    return
+        except OSError:
+            pass
+        with open(css_file, 'w', encoding='utf-8') as f:
+            f.write(css)
+    
+    def get_report_cache_key(self, data: Dict, affected_components: int) -> str:
+        """Digest of everything the comprehensive report body is rendered from (timestamp and totals excluded)."""
         stats = data['statistics']
-        vulns = data['detailed_vulnerabilities']
+        rows = []
+        for vuln in data['detailed_vulnerabilities']:
+            try:
+                rows.append(COMPREHENSIVE_VULNERABILITY_ROW_FIELDS(vuln))
+            except KeyError:
+                # Only records missing a column pay for merging in the rendered defaults
+                rows.append(COMPREHENSIVE_VULNERABILITY_ROW_FIELDS({**COMPREHENSIVE_VULNERABILITY_ROW_DEFAULTS, **vuln}))
+        repo_summary = {
+            repo: [summary['total_vulnerabilities'], sorted(summary['components_with_vulnerabilities'])]
+            for repo, summary in stats['repository_summary'].items()
+        }
+        # Module timestamps invalidate the cache whenever the renderer or its templates change
+        renderer = [os.path.getmtime(__file__), os.path.getmtime(report_templates.__file__)]
+        material = json.dumps([renderer, stats['severity_breakdown'], repo_summary, affected_components, rows], sort_keys=True)
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+    
+    def open_report_file(self, report_file: str):
+        """Open a consolidated report for buffered text writing, gzip-compressed when the name ends in .gz."""
+        if report_file.endswith('.gz'):
+            return gzip.open(report_file, 'wt', encoding='utf-8', compresslevel=6)
+        return open(report_file, 'w', encoding='utf-8', buffering=self.report_write_buffer)
+    
+    def write_comprehensive_html(self, html_file: str, data: Dict, timestamp: str, affected_components: int):
+        """Write the comprehensive HTML report, reusing the previous run's rendered body when findings are unchanged."""
+        header = COMPREHENSIVE_REPORT_HEADER.substitute(data['statistics']['overall'], timestamp=timestamp,
+                                                        nexus_url=html.escape(data['scan_metadata']['nexus_url']))
+        if not data['detailed_vulnerabilities']:
+            # Clean scan: the body is a static constant, cheaper to write than to hash and cache
+            with self.open_report_file(html_file) as f:
+                f.write(header)
+                f.write(COMPREHENSIVE_EMPTY_BODY)
+            return
         
-        html = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Comprehensive Nexus Security Report</title>
-    <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            margin: 0;
-            padding: 20px;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-        }}
-        .container {{
-            max-width: 1400px;
-            margin: 0 auto;
-            background-color: white;
-            border-radius: 15px;
-            box-shadow: 0 20px 40px rgba(0,0,0,0.1);
-            overflow: hidden;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #2c3e50 0%, #34495e 100%);
-            color: white;
-            padding: 30px;
-            text-align: center;
-        }}
-        .header h1 {{
-            margin: 0 0 10px 0;
-            font-size: 2.5em;
-        }}
-        .dashboard {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 20px;
-            padding: 30px;
-            background-color: #f8f9fa;
-        }}
-        .metric-card {{
-            background: white;
-            border-radius: 10px;
-            padding: 25px;
-            text-align: center;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.08);
-            transition: transform 0.3s ease;
-        }}
-        .metric-card:hover {{
-            transform: translateY(-5px);
-        }}
-        .metric-number {{
-            font-size: 3em;
-            font-weight: bold;
-            margin-bottom: 10px;
-        }}
-        .metric-label {{
-            color: #6c757d;
-            font-size: 1.1em;
-        }}
-        .severity-chart {{
-            padding: 30px;
-        }}
-        .severity-bar {{
-            margin: 10px 0;
-        }}
-        .severity-bar-fill {{
-            height: 30px;
-            border-radius: 15px;
-            display: flex;
-            align-items: center;
-            padding: 0 15px;
-            color: white;
-            font-weight: bold;
-        }}
-        .critical {{ background-color: #8e44ad; }}
-        .high {{ background-color: #e74c3c; }}
-        .medium {{ background-color: #f39c12; }}
-        .low {{ background-color: #f1c40f; color: #333; }}
-        .unknown {{ background-color: #95a5a6; }}
-        
-        /* Enhanced Severity Section Styles */
-        .severity-overview {{
-            background: white;
-            border-radius: 10px;
-            padding: 25px;
-            margin: 20px 0;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.08);
-        }}
-        .severity-item {{
-            margin-bottom: 20px;
-            padding: 15px;
-            background-color: #f8f9fa;
-            border-radius: 8px;
-        }}
-        .severity-header {{
-            display: flex;
-            align-items: center;
-            margin-bottom: 10px;
-            font-weight: bold;
-        }}
-        .severity-icon {{
-            font-size: 1.5em;
-            margin-right: 10px;
-        }}
-        .severity-name {{
-            flex: 1;
-            font-size: 1.2em;
-        }}
-        .severity-count {{
-            font-size: 1.5em;
-            color: #2c3e50;
-            margin-right: 10px;
-        }}
-        .severity-percentage {{
-            color: #6c757d;
-            font-size: 1em;
-        }}
-        .severity-bar {{
-            height: 20px;
-            background-color: #e9ecef;
-            border-radius: 10px;
-            overflow: hidden;
-            margin: 10px 0;
-        }}
-        .severity-bar-fill {{
-            height: 100%;
-            border-radius: 10px;
-            transition: width 0.3s ease;
-        }}
-        .severity-description {{
-            color: #6c757d;
-            font-size: 0.9em;
-            font-style: italic;
-            margin-top: 5px;
-        }}
-        .vulnerability-summary {{
-            background: white;
-            border-radius: 10px;
-            padding: 25px;
-            margin: 20px 0;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.08);
-        }}
-        .summary-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            margin-top: 15px;
-        }}
-        .summary-item {{
-            text-align: center;
-            padding: 20px;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            border-radius: 10px;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.1);
-        }}
-        .summary-number {{
-            font-size: 2.5em;
-            font-weight: bold;
-            margin-bottom: 5px;
-        }}
-        .summary-label {{
-            font-size: 0.9em;
-            opacity: 0.9;
-        }}
+        cache_key = self.get_report_cache_key(data, affected_components)
+        key_line = f"<!-- report-cache-key: {cache_key} -->\n"
         
-        .repo-section {{
-            padding: 20px 30px;
-        }}
-        .repo-card {{
-            background: white;
-            border: 1px solid #dee2e6;
-            border-radius: 10px;
-            margin: 15px 0;
-            overflow: hidden;
-        }}
-        .repo-header {{
-            background-color: #007bff;
-            color: white;
-            padding: 20px;
-            font-size: 1.2em;
-            font-weight: bold;
-        }}
-        .repo-content {{
-            padding: 20px;
-        }}
-        .vulnerability-list {{
-            margin-top: 20px;
-        }}
-        .vuln-item {{
-            background-color: #f8f9fa;
-            border-left: 4px solid #e74c3c;
-            padding: 15px;
-            margin: 10px 0;
-            border-radius: 0 5px 5px 0;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>Comprehensive Security Analysis Report</h1>
-            <p>Nexus Repository Vulnerability Assessment</p>
-            <p>Generated: {timestamp} | Server: {data['scan_metadata']['nexus_url']}</p>
-        </div>
+        try:
+            with open(self.report_cache_file, 'r', encoding='utf-8') as cache:
+                if cache.readline() == key_line:
+                    with self.open_report_file(html_file) as f:
+                        f.write(header)
+                        shutil.copyfileobj(cache, f, self.report_write_buffer)
+                    self.logger.info("Findings unchanged since the previous run - reused cached comprehensive report body")
+                    return
+        except OSError:
+            pass
+        
+        # Render once, teeing the body into a fresh cache file that replaces the old one only when complete
+        os.makedirs(os.path.dirname(self.report_cache_file), exist_ok=True)
+        pending_cache_file = f"{self.report_cache_file}.tmp"
+        with self.open_report_file(html_file) as f, \
+                open(pending_cache_file, 'w', encoding='utf-8', buffering=self.report_write_buffer) as cache:
+            f.write(header)
+            cache.write(key_line)
+            for chunk in self._iter_comprehensive_body(data, affected_components):
+                f.write(chunk)
+                cache.write(chunk)
+        os.replace(pending_cache_file, self.report_cache_file)
+    
+    def _iter_comprehensive_body(self, data: Dict, affected_components: int) -> Iterator[str]:
+        """Yield the comprehensive HTML report body (everything below the header) fragment by fragment."""
+        stats = data['statistics']
+        vulns = data['detailed_vulnerabilities']
         
-        <div class="dashboard">
-            <div class="metric-card">
-                <div class="metric-number" style="color: #007bff;">{stats['overall']['repositories_scanned']}</div>
-                <div class="metric-label">Repositories</div>
-            </div>
-            <div class="metric-card">
-                <div class="metric-number" style="color: #28a745;">{stats['overall']['components_found']}</div>
-                <div class="metric-label">Components</div>
-            </div>
-            <div class="metric-card">
-                <div class="metric-number" style="color: #17a2b8;">{stats['overall']['assets_scanned']}</div>
-                <div class="metric-label">Assets Scanned</div>
-            </div>
-            <div class="metric-card">
-                <div class="metric-number" style="color: #dc3545;">{stats['overall']['vulnerabilities_found']}</div>
-                <div class="metric-label">Vulnerabilities</div>
-            </div>
-        </div>
-"""
-
         # Enhanced Vulnerability Severity Section
         if stats['severity_breakdown']:
-            html += """
+            yield """
         <div class="severity-chart">
             <h2>🚨 Vulnerability Severity Analysis</h2>
             <div class="severity-overview">
 """
             total_vulns = sum(stats['severity_breakdown'].values())
             
-            # Define severity colors and icons
-            severity_info = {
-                'CRITICAL': {'color': '#8e44ad', 'icon': '🔴', 'description': 'Critical vulnerabilities requiring immediate action'},
-                'HIGH': {'color': '#e74c3c', 'icon': '🟠', 'description': 'High severity vulnerabilities requiring urgent attention'},
-                'MEDIUM': {'color': '#f39c12', 'icon': '🟡', 'description': 'Medium severity vulnerabilities requiring timely resolution'},
-                'LOW': {'color': '#f1c40f', 'icon': '🟢', 'description': 'Low severity vulnerabilities for routine maintenance'},
-                'UNKNOWN': {'color': '#95a5a6', 'icon': '⚪', 'description': 'Unknown severity vulnerabilities requiring assessment'}
-            }
-            
-            # Sort severities by priority
-            severity_order = ['CRITICAL', 'HIGH', 'MEDIUM', 'LOW', 'UNKNOWN']
-            
-            for severity in severity_order:
+            for severity in SEVERITY_CHART_ORDER:
                 count = stats['severity_breakdown'].get(severity, 0)
                 if count > 0:
                     percentage = (count / total_vulns) * 100
-                    info = severity_info.get(severity, {'color': '#95a5a6', 'icon': '⚪', 'description': 'Unknown severity'})
+                    percentage_label = format(percentage, '.1f')
                     
-                    html += f"""
-                <div class="severity-item">
-                    <div class="severity-header">
-                        <span class="severity-icon">{info['icon']}</span>
-                        <span class="severity-name">{severity}</span>
-                        <span class="severity-count">{count:,}</span>
-                        <span class="severity-percentage">({percentage:.1f}%)</span>
-                    </div>
-                    <div class="severity-bar">
-                        <div class="severity-bar-fill {severity.lower()}" style="width: {percentage}%; background-color: {info['color']};">
-                        </div>
-                    </div>
-                    <div class="severity-description">{info['description']}</div>
-                </div>
-"""
+                    yield COMPREHENSIVE_SEVERITY_ITEM.format_map(dict(
+                        SEVERITY_CHART_INFO[severity], severity=severity, count=count, percentage=percentage,
+                        percentage_label=percentage_label, css_class=SEVERITY_CSS_CLASSES[severity]))
             
             # Add summary section
-            html += f"""
+            yield f"""
             </div>
             <div class="vulnerability-summary">
                 <h3>📊 Summary</h3>
@@ -2760,11 +3027,11 @@ class CleanNexusScanner:
                             <div style="font-size: 0.9em; color: #666;">Total Vulnerabilities</div>
                         </div>
                         <div>
-                            <div style="font-size: 1.5em; font-weight: bold; color: #007bff;">{len(set(v.get('component', 'Unknown') for v in vulns)):,}</div>
+                            <div style="font-size: 1.5em; font-weight: bold; color: #007bff;">{affected_components:,}</div>
                             <div style="font-size: 0.9em; color: #666;">Affected Components</div>
                         </div>
                         <div>
-                            <div style="font-size: 1.5em; font-weight: bold; color: #007bff;">{len(set(v.get('repository', 'Unknown') for v in vulns)):,}</div>
+                            <div style="font-size: 1.5em; font-weight: bold; color: #007bff;">{len(stats['repository_summary']):,}</div>
                             <div style="font-size: 0.9em; color: #666;">Affected Repositories</div>
                         </div>
                     </div>
@@ -2775,121 +3042,43 @@ class CleanNexusScanner:
 
         # Vulnerability Details Table
         if vulns:
-            html += """
-        <div class="vulnerability-details-section">
-            <h2>🔍 Vulnerability Details</h2>
-            <div class="table-container" style="overflow-x: auto; margin: 20px 0; border: 1px solid #ddd; border-radius: 8px;">
-                <table style="width: 100%; border-collapse: collapse; background: white;">
-                    <thead style="background: #f8f9fa; border-bottom: 2px solid #dee2e6;">
-                        <tr>
-                            <th style="padding: 12px; text-align: left; font-weight: 600; color: #495057;">Component</th>
-                            <th style="padding: 12px; text-align: left; font-weight: 600; color: #495057;">Package</th>
-                            <th style="padding: 12px; text-align: left; font-weight: 600; color: #495057;">Vulnerability ID</th>
-                            <th style="padding: 12px; text-align: left; font-weight: 600; color: #495057;">Severity</th>
-                            <th style="padding: 12px; text-align: left; font-weight: 600; color: #495057;">Installed Version</th>
-                            <th style="padding: 12px; text-align: left; font-weight: 600; color: #495057;">Fixed Version</th>
-                            <th style="padding: 12px; text-align: left; font-weight: 600; color: #495057;">Repository</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-"""
+            yield COMPREHENSIVE_DETAILS_TABLE_HEADER
             # Sort vulnerabilities by severity for better visibility
             severity_order = {'CRITICAL': 0, 'HIGH': 1, 'MEDIUM': 2, 'LOW': 3, 'UNKNOWN': 4}
             sorted_vulns = sorted(vulns, key=lambda x: (severity_order.get(x.get('severity', 'UNKNOWN'), 5), x.get('vulnerability_id', '')))
             
+            # Bind the per-row callables once; this loop runs for every finding
+            escape_fields = self.escape_html_fields
+            badge_color = SEVERITY_BADGE_COLORS.get
+            row_background = SEVERITY_ROW_BACKGROUNDS.get
+            render_row = COMPREHENSIVE_VULNERABILITY_ROW.format_map
+            
             for vuln in sorted_vulns:
-                severity = vuln.get('severity', 'UNKNOWN')
-                severity_color = {
-                    'CRITICAL': '#d73527',
-                    'HIGH': '#fd7e14', 
-                    'MEDIUM': '#ffc107',
-                    'LOW': '#28a745',
-                    'UNKNOWN': '#6c757d'
-                }.get(severity, '#6c757d')
-                
-                severity_bg = {
-                    'CRITICAL': 'rgba(215, 53, 39, 0.1)',
-                    'HIGH': 'rgba(253, 126, 20, 0.1)',
-                    'MEDIUM': 'rgba(255, 193, 7, 0.1)',
-                    'LOW': 'rgba(40, 167, 69, 0.1)',
-                    'UNKNOWN': 'rgba(108, 117, 125, 0.1)'
-                }.get(severity, 'rgba(108, 117, 125, 0.1)')
-                
-                component = vuln.get('component', 'Unknown')
-                package = vuln.get('pkg_name', 'N/A')
-                vuln_id = vuln.get('vulnerability_id', 'N/A')
-                installed_version = vuln.get('pkg_version', 'N/A')
-                fixed_version = vuln.get('fixed_version', 'N/A')
-                repository = vuln.get('repository', 'Unknown')
-                
-                html += f"""
-                        <tr style="border-bottom: 1px solid #dee2e6; background: {severity_bg if severity in ['CRITICAL', 'HIGH'] else 'white'};">
-                            <td style="padding: 10px; font-family: monospace; font-size: 0.9em;">{component}</td>
-                            <td style="padding: 10px; font-family: monospace; font-size: 0.9em;">{package}</td>
-                            <td style="padding: 10px;">
-                                <span style="font-family: monospace; color: #0066cc; font-weight: 500;">{vuln_id}</span>
-                            </td>
-                            <td style="padding: 10px;">
-                                <span style="background: {severity_color}; color: white; padding: 4px 8px; border-radius: 4px; font-size: 0.8em; font-weight: 600;">{severity}</span>
-                            </td>
-                            <td style="padding: 10px; font-family: monospace; color: #dc3545;">{installed_version}</td>
-                            <td style="padding: 10px; font-family: monospace; color: #28a745;">{fixed_version}</td>
-                            <td style="padding: 10px; font-size: 0.9em;">{repository}</td>
-                        </tr>
-"""
+                fields = escape_fields(vuln, COMPREHENSIVE_VULNERABILITY_ROW_DEFAULTS)
+                fields['severity_color'] = badge_color(fields['severity'], '#6c757d')
+                fields['row_background'] = row_background(fields['severity'], 'white')
+                yield render_row(fields)
             
-            html += """
-                    </tbody>
-                </table>
-            </div>
-            <div style="margin: 10px 0; color: #666; font-size: 0.9em;">
-                <p><strong>📋 Legend:</strong> Critical and High severity vulnerabilities are highlighted with colored backgrounds. Vulnerability details are sorted by severity.</p>
-            </div>
-        </div>
-"""
+            yield COMPREHENSIVE_DETAILS_TABLE_FOOTER
 
         # Repository details
         if stats['repository_summary']:
-            html += """
+            yield """
         <div class="repo-section">
             <h2>Repository Analysis</h2>
 """
             for repo_name, repo_data in stats['repository_summary'].items():
-                html += f"""
-            <div class="repo-card">
-                <div class="repo-header">{repo_name}</div>
-                <div class="repo-content">
-                    <p><strong>Total Vulnerabilities:</strong> {repo_data['total_vulnerabilities']}</p>
-                    <p><strong>Affected Components:</strong> {repo_data['unique_components_with_vulns']}</p>
-                    <div class="vulnerability-list">
-                        <h4>Components with vulnerabilities:</h4>
-                        <ul>
-"""
+                yield COMPREHENSIVE_REPOSITORY_CARD_HEADER.format_map(dict(repo_data, repo_name=html.escape(repo_name)))
                 for component in repo_data['components_with_vulnerabilities']:
-                    html += f"                            <li>{component}</li>"
+                    yield COMPREHENSIVE_COMPONENT_ITEM.format(html.escape(component))
                 
-                html += """
-                        </ul>
-                    </div>
-                </div>
-            </div>
-"""
-            html += "        </div>"
+                yield COMPREHENSIVE_REPOSITORY_CARD_FOOTER
+            yield "        </div>"
 
         if not vulns:
-            html += """
-        <div style="padding: 40px; text-align: center; background-color: #d4edda; color: #155724; margin: 20px;">
-            <h2>🎉 Security Status: CLEAN</h2>
-            <p>No security vulnerabilities were detected in any scanned repositories!</p>
-        </div>
-"""
+            yield COMPREHENSIVE_CLEAN_STATUS
 
-        html += """
-    </div>
-</body>
-</html>
-"""
-        return html
+        yield REPORT_FOOTER
     
     def print_summary(self):
         """Print comprehensive scan summary with detailed diagnostics."""
@@ -2998,19 +3187,16 @@ class CleanNexusScanner:
         
         self.logger.info("=" * 60)
     
-    def move_reports_to_timestamped_folder(self, scan_timestamp: str):
+    def move_reports_to_timestamped_folder(self, file_stamp: str):
         """Create a timestamped folder and move all generated reports into it."""
         try:
-            # Create timestamped folder name
-            folder_timestamp = scan_timestamp.replace(":", "-").replace(".", "-")
-            timestamped_folder = os.path.join(self.output_dir, f"scan_reports_{folder_timestamp}")
+            timestamped_folder = os.path.join(self.output_dir, f"scan_reports_{file_stamp}")
             
             # Create the timestamped folder
             os.makedirs(timestamped_folder, exist_ok=True)
             self.logger.info(f"Created timestamped report folder: {timestamped_folder}")
             
             # Collect all report files that match the timestamp
-            timestamp_pattern = scan_timestamp.replace(":", "-")
             report_files = []
             subfolders_to_move = []
             
@@ -3020,7 +3206,7 @@ class CleanNexusScanner:
                 
                 if os.path.isfile(item_path):
                     # Check if file matches our timestamp pattern
-                    if timestamp_pattern in item:
+                    if file_stamp in item:
                         report_files.append(item)
                 elif os.path.isdir(item_path) and item == 'individual_files_reports' and self.retain_individual_reports:
                     # Only move individual_files_reports folder if retention is enabled
@@ -6,33 +6,58 @@ Loads configuration from .env file and local paths
 
 import os
 import sys
+import shutil
+import functools
 from pathlib import Path
 
-def load_env_file(env_path=".env"):
-    """Load environment variables from .env file"""
+# Parsed .env files keyed by path, with the (mtime, size) they were parsed at
+_env_file_cache = {}
+
+def load_env_file(env_path=".env", export=False):
+    """Load variables from .env file; export=True also sets them in os.environ"""
+    env_vars = _read_env_file(env_path)
+    if export:
+        os.environ.update(env_vars)
+    return env_vars
+
+def _read_env_file(env_path):
+    """Parse a .env file (re-parsed only when the file changes)"""
     env_vars = {}
     
-    if not os.path.exists(env_path):
+    try:
+        st = os.stat(env_path)
+    except OSError:
         return env_vars
     
+    file_version = (st.st_mtime_ns, st.st_size)
+    cached = _env_file_cache.get(env_path)
+    if cached is not None and cached[0] == file_version:
+        return dict(cached[1])
+    
     try:
         with open(env_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip().strip('"').strip("'")
-                    env_vars[key] = value
-                    # Also set as environment variable
-                    os.environ[key] = value
+            data = f.read()
+        
+        # Text mode already normalised line endings; splitlines() would also break on \v, \f and other separators
+        for line in data.split('\n'):
+            line = line.strip()
+            if not line or line[0] == '#':
+                continue
+            key, sep, value = line.partition('=')
+            key = key.strip()
+            if not sep or not key:
+                continue
+            env_vars[key] = value.strip().strip('"').strip("'")
     except Exception as e:
         print(f"Warning: Could not load .env file: {e}")
+        return env_vars
     
+    _env_file_cache[env_path] = (file_version, dict(env_vars))
     return env_vars
 
+@functools.lru_cache(maxsize=1)
 def get_trivy_path():
-    """Get path to local Trivy executable"""
+    """Get path to local Trivy executable (probed once per process)"""
     script_dir = Path(__file__).parent
     trivy_paths = [
         "/tmp/tools/trivy/trivy",               # Linux deployment path
@@ -48,7 +73,6 @@ def get_trivy_path():
             return str(trivy_path.absolute())
         elif isinstance(trivy_path, str):
             # Check if trivy is in PATH
-            import shutil
             if shutil.which(trivy_path):
                 return trivy_path
     
@@ -76,6 +100,9 @@ def get_config():
         'debug_http_requests': env_vars.get('DEBUG_HTTP_REQUESTS', os.getenv('DEBUG_HTTP_REQUESTS', 'false')).lower() == 'true',
         'retain_individual_reports': env_vars.get('RETAIN_INDIVIDUAL_REPORTS', os.getenv('RETAIN_INDIVIDUAL_REPORTS', 'false')).lower() == 'true',
         'skip_pre_scan_component_count': env_vars.get('SKIP_PRE_SCAN_COMPONENT_COUNT', os.getenv('SKIP_PRE_SCAN_COMPONENT_COUNT', 'false')).lower() == 'true',
+        'scan_temp_dir': env_vars.get('SCAN_TEMP_DIR', os.getenv('SCAN_TEMP_DIR', '')),
+        'compress_reports': env_vars.get('COMPRESS_REPORTS', os.getenv('COMPRESS_REPORTS', 'false')).lower() == 'true',
+        'trivy_server_mode': env_vars.get('TRIVY_SERVER_MODE', os.getenv('TRIVY_SERVER_MODE', 'true')).lower() == 'true',
         'scan_artifacts_from_date': env_vars.get('SCAN_ARTIFACTS_FROM_DATE', os.getenv('SCAN_ARTIFACTS_FROM_DATE', ''))
     }
     
@@ -5,6 +5,7 @@ Monitors the scanner log file and shows current progress and phase transitions.
 """
 
 import os
+import sys
 import time
 import re
 from datetime import datetime
@@ -16,90 +17,164 @@ def get_latest_log_file():
     if not os.path.exists(log_dir):
         return None
     
-    log_files = []
-    for file in os.listdir(log_dir):
-        if file.startswith("nexus_scanner_debug_") and file.endswith(".log"):
-            log_files.append(os.path.join(log_dir, file))
+    # scandir entries carry the path and a cached stat, so each candidate is stat'ed once
+    with os.scandir(log_dir) as entries:
+        log_files = [(entry.stat().st_ctime, entry.path) for entry in entries
+                     if entry.name.startswith("nexus_scanner_debug_") and entry.name.endswith(".log")]
     
     if not log_files:
         return None
     
     # Get the most recent log file
-    latest_log = max(log_files, key=os.path.getctime)
+    latest_log = max(log_files)[1]
     return latest_log
 
-def parse_log_progress(log_file):
-    """Parse the log file to extract current progress."""
-    if not os.path.exists(log_file):
-        return None
-    
-    progress = {
-        'phase': 'unknown',
-        'current_repository': 'unknown',
-        'components_found': 0,
+# All progress lines in one pattern, so each log line is searched once; lastgroup names the kind of line.
+# Nexus repository names, formats and types contain no whitespace, so \S+ replaces the backtracking .+? there.
+LOG_LINE_PATTERN = re.compile(
+    r'(?P<repository>=== SCANNING REPOSITORY: (?P<repository_name>\S+) \(format: \S+, type: \S+\) ===)'
+    r'|(?P<retrieved>Retrieved \d+ components \(total: (?P<components_total>\d+)\))'
+    r'|(?P<processing>Processing component (?P<component_index>\d+)/\d+: (?P<component_name>.+))'
+    r'|(?P<scanning>SCANNING:)'
+    r'|(?P<vulnerabilities>Found (?P<vulnerability_count>\d+) vulnerabilities)'
+    r'|(?P<report>Individual HTML report retained:)',
+    re.ASCII
+)
+
+# Refresh every second while the log grows, backing off to 30 seconds while the scanner is quiet
+MIN_POLL_INTERVAL = 1
+MAX_POLL_INTERVAL = 30
+
+# ANSI cursor-home + erase-display; clears the terminal without starting a cls/clear process
+CLEAR_SCREEN = "\x1b[H\x1b[2J"
+
+# Phase indicator
+PHASE_EMOJI = {
+    'discovering_components': '🔍',
+    'scanning_assets': '🛡️',
+    'generating_reports': '📄',
+    'completed': '✅'
+}
+
+PHASE_NAMES = {
+    'discovering_components': 'Discovering Components',
+    'scanning_assets': 'Scanning Assets for Vulnerabilities',
+    'generating_reports': 'Generating Reports',
+    'completed': 'Scan Complete'
+}
+
+# Helpful tips based on phase
+PHASE_TIPS = {
+    'discovering_components': "\n".join([
+        "💡 WHAT'S HAPPENING:",
+        "   • Scanner is retrieving all components from repositories",
+        "   • This can take time for large npm repositories (10-30 minutes)",
+        "   • Individual reports will be created during asset scanning phase"
+    ]),
+    'scanning_assets': "\n".join([
+        "💡 WHAT'S HAPPENING:",
+        "   • Scanner is downloading and scanning individual assets",
+        "   • Individual HTML reports are being generated and organized",
+        "   • Reports separated into 'with_vulnerabilities' and 'empty_reports' folders"
+    ])
+}
+
+# Per log file: bytes consumed so far, running totals and the newest phase line
+_log_state = {}
+
+def _new_log_state():
+    """Counters for a log file that has not been read yet."""
+    return {
+        'offset': 0,
+        'pending': b'',
+        'phase_match': None,
         'components_processed': 0,
+        'current_component': 'unknown',
+        'last_processing_activity': None,
         'assets_scanned': 0,
         'vulnerabilities_found': 0,
-        'reports_generated': 0,
-        'last_activity': 'unknown',
-        'repositories_completed': [],
-        'current_component': 'unknown'
+        'reports_generated': 0
     }
+
+def parse_log_progress(log_file):
+    """Parse the log file to extract current progress."""
+    try:
+        log_size = os.stat(log_file).st_size
+    except OSError:
+        return None
     
     try:
-        with open(log_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        state = _log_state.get(log_file)
+        if state is None or log_size < state['offset']:
+            # First poll, or the log was truncated: count from the beginning again
+            state = _log_state[log_file] = _new_log_state()
+        
+        # Only the bytes appended since the previous poll are read
+        with open(log_file, 'rb') as f:
+            f.seek(state['offset'])
+            new_data = f.read(log_size - state['offset'])
+        state['offset'] += len(new_data)
+        
+        # A line still being written is held back until its newline arrives
+        raw_lines = (state['pending'] + new_data).split(b'\n')
+        state['pending'] = raw_lines.pop()
+        
+        for raw_line in raw_lines:
+            match = LOG_LINE_PATTERN.search(raw_line.rstrip(b'\r').decode('utf-8', errors='replace'))
+            if match is None:
+                continue
+            kind = match.lastgroup
             
-        # Process lines from most recent to oldest for current state
-        repo_pattern = re.compile(r'=== SCANNING REPOSITORY: (.+?) \(format: (.+?), type: (.+?)\) ===')
-        component_retrieval_pattern = re.compile(r'Retrieved (\d+) components \(total: (\d+)\)')
-        component_processing_pattern = re.compile(r'Processing component (\d+)/(\d+): (.+?)$')
-        scanning_pattern = re.compile(r'SCANNING: (.+?) \(Type: (.+?)\)')
-        vulnerability_pattern = re.compile(r'Found (\d+) vulnerabilities')
-        report_pattern = re.compile(r'Individual HTML report retained:')
-        
-        current_repo = 'unknown'
-        
-        for line in reversed(lines[-500:]):  # Check last 500 lines for efficiency
-            line = line.strip()
+            # Lines are read in order, so the last repository/retrieval line seen gives the current phase
+            if kind == 'repository' or kind == 'retrieved':
+                state['phase_match'] = match
             
-            # Check for repository scanning
-            repo_match = repo_pattern.search(line)
-            if repo_match:
-                current_repo = repo_match.group(1)
-                progress['current_repository'] = current_repo
-                progress['phase'] = 'scanning_assets'
-                break
-                
-            # Check for component retrieval (still in discovery phase)
-            comp_retrieval_match = component_retrieval_pattern.search(line)
-            if comp_retrieval_match and current_repo == 'unknown':
-                progress['components_found'] = int(comp_retrieval_match.group(2))
-                progress['phase'] = 'discovering_components'
-                progress['last_activity'] = f"Retrieving components (found {comp_retrieval_match.group(2)})"
-                break
-        
-        # Count totals from entire log
-        for line in lines:
             # Count processing progress
-            comp_proc_match = component_processing_pattern.search(line)
-            if comp_proc_match:
-                progress['components_processed'] = int(comp_proc_match.group(1))
-                progress['current_component'] = comp_proc_match.group(3)
-                progress['last_activity'] = f"Processing {comp_proc_match.group(3)}"
+            elif kind == 'processing':
+                state['components_processed'] = int(match.group('component_index'))
+                state['current_component'] = match.group('component_name')
+                state['last_processing_activity'] = f"Processing {match.group('component_name')}"
             
             # Count scanned assets
-            if 'SCANNING:' in line:
-                progress['assets_scanned'] += 1
+            elif kind == 'scanning':
+                state['assets_scanned'] += 1
             
             # Count vulnerabilities
-            vuln_match = vulnerability_pattern.search(line)
-            if vuln_match:
-                progress['vulnerabilities_found'] += int(vuln_match.group(1))
+            elif kind == 'vulnerabilities':
+                state['vulnerabilities_found'] += int(match.group('vulnerability_count'))
             
             # Count reports generated
-            if 'Individual HTML report retained:' in line:
-                progress['reports_generated'] += 1
+            elif kind == 'report':
+                state['reports_generated'] += 1
+        
+        progress = {
+            'phase': 'unknown',
+            'current_repository': 'unknown',
+            'components_found': 0,
+            'components_processed': state['components_processed'],
+            'assets_scanned': state['assets_scanned'],
+            'vulnerabilities_found': state['vulnerabilities_found'],
+            'reports_generated': state['reports_generated'],
+            'last_activity': 'unknown',
+            'repositories_completed': [],
+            'current_component': state['current_component']
+        }
+        
+        match = state['phase_match']
+        
+        # Check for repository scanning
+        if match is not None and match.lastgroup == 'repository':
+            progress['current_repository'] = match.group('repository_name')
+            progress['phase'] = 'scanning_assets'
+        
+        # Check for component retrieval (still in discovery phase)
+        elif match is not None:
+            progress['components_found'] = int(match.group('components_total'))
+            progress['phase'] = 'discovering_components'
+            progress['last_activity'] = f"Retrieving components (found {match.group('components_total')})"
+        
+        if state['last_processing_activity'] is not None:
+            progress['last_activity'] = state['last_processing_activity']
         
         return progress
         
@@ -109,10 +184,8 @@ def parse_log_progress(log_file):
 
 def format_time_elapsed(start_time):
     """Format elapsed time in a readable format."""
-    elapsed = time.time() - start_time
-    hours = int(elapsed // 3600)
-    minutes = int((elapsed % 3600) // 60)
-    seconds = int(elapsed % 60)
+    minutes, seconds = divmod(int(time.time() - start_time), 60)
+    hours, minutes = divmod(minutes, 60)
     
     if hours > 0:
         return f"{hours}h {minutes}m {seconds}s"
@@ -121,88 +194,77 @@ def format_time_elapsed(start_time):
     else:
         return f"{seconds}s"
 
-def display_progress(progress, start_time):
-    """Display the current progress in a nice format."""
-    os.system('cls' if os.name == 'nt' else 'clear')  # Clear screen
+def format_start_time(start_time):
+    """Format the scan start time shown in the monitor header."""
+    return datetime.fromtimestamp(start_time).strftime('%Y-%m-%d %H:%M:%S')
+
+def display_progress(progress, start_time, started=None):
+    """Display the current progress in a nice format. Pass started to reuse a preformatted start time."""
+    if started is None:
+        started = format_start_time(start_time)
     
-    print("🔍 NEXUS SCANNER PROGRESS MONITOR")
-    print("=" * 50)
-    print(f"⏱️  Runtime: {format_time_elapsed(start_time)}")
-    print(f"📅 Started: {datetime.fromtimestamp(start_time).strftime('%Y-%m-%d %H:%M:%S')}")
-    print()
+    # The frame is collected and written in one call, so the screen is cleared and redrawn in one go
+    lines = []
+    lines.append("🔍 NEXUS SCANNER PROGRESS MONITOR")
+    lines.append("=" * 50)
+    lines.append(f"⏱️  Runtime: {format_time_elapsed(start_time)}")
+    lines.append(f"📅 Started: {started}")
+    lines.append("")
     
     if progress:
         # Phase indicator
-        phase_emoji = {
-            'discovering_components': '🔍',
-            'scanning_assets': '🛡️',
-            'generating_reports': '📄',
-            'completed': '✅'
-        }
+        emoji = PHASE_EMOJI.get(progress['phase'], '❓')
+        name = PHASE_NAMES.get(progress['phase'], progress['phase'].title())
         
-        phase_name = {
-            'discovering_components': 'Discovering Components',
-            'scanning_assets': 'Scanning Assets for Vulnerabilities', 
-            'generating_reports': 'Generating Reports',
-            'completed': 'Scan Complete'
-        }
-        
-        emoji = phase_emoji.get(progress['phase'], '❓')
-        name = phase_name.get(progress['phase'], progress['phase'].title())
-        
-        print(f"🎯 Current Phase: {emoji} {name}")
-        print(f"📂 Repository: {progress['current_repository']}")
-        print()
+        lines.append(f"🎯 Current Phase: {emoji} {name}")
+        lines.append(f"📂 Repository: {progress['current_repository']}")
+        lines.append("")
         
         # Progress statistics
-        print("📊 PROGRESS STATISTICS:")
+        lines.append("📊 PROGRESS STATISTICS:")
         if progress['phase'] == 'discovering_components':
-            print(f"   🔍 Components Found: {progress['components_found']:,}")
-            print(f"   📝 Last Activity: {progress['last_activity']}")
+            lines.append(f"   🔍 Components Found: {progress['components_found']:,}")
+            lines.append(f"   📝 Last Activity: {progress['last_activity']}")
         else:
-            print(f"   🔍 Components Found: {progress['components_found']:,}")
-            print(f"   ⚡ Components Processed: {progress['components_processed']:,}")
-            print(f"   🛡️ Assets Scanned: {progress['assets_scanned']:,}")
-            print(f"   🚨 Vulnerabilities Found: {progress['vulnerabilities_found']:,}")
-            print(f"   📄 Reports Generated: {progress['reports_generated']:,}")
+            lines.append(f"   🔍 Components Found: {progress['components_found']:,}")
+            lines.append(f"   ⚡ Components Processed: {progress['components_processed']:,}")
+            lines.append(f"   🛡️ Assets Scanned: {progress['assets_scanned']:,}")
+            lines.append(f"   🚨 Vulnerabilities Found: {progress['vulnerabilities_found']:,}")
+            lines.append(f"   📄 Reports Generated: {progress['reports_generated']:,}")
             
             if progress['current_component'] != 'unknown':
-                print(f"   🔧 Current Component: {progress['current_component']}")
+                lines.append(f"   🔧 Current Component: {progress['current_component']}")
         
-        print()
+        lines.append("")
         
         # Individual reports status
         if progress['reports_generated'] > 0:
-            print("📁 INDIVIDUAL REPORTS:")
-            print(f"   📂 Reports Location: ./vulnerability_reports/individual_files_reports/")
-            print(f"   📊 Total Reports: {progress['reports_generated']}")
-            print("   📁 Organization: Separated by vulnerability status and repository")
+            lines.append("📁 INDIVIDUAL REPORTS:")
+            lines.append(f"   📂 Reports Location: ./vulnerability_reports/individual_files_reports/")
+            lines.append(f"   📊 Total Reports: {progress['reports_generated']}")
+            lines.append("   📁 Organization: Separated by vulnerability status and repository")
         elif progress['phase'] == 'scanning_assets':
-            print("📁 INDIVIDUAL REPORTS:")
-            print("   ⏳ Reports will appear once asset scanning completes...")
+            lines.append("📁 INDIVIDUAL REPORTS:")
+            lines.append("   ⏳ Reports will appear once asset scanning completes...")
         else:
-            print("📁 INDIVIDUAL REPORTS:")
-            print("   ⏳ Reports will be generated after component discovery completes...")
+            lines.append("📁 INDIVIDUAL REPORTS:")
+            lines.append("   ⏳ Reports will be generated after component discovery completes...")
         
-        print()
+        lines.append("")
         
         # Helpful tips based on phase
-        if progress['phase'] == 'discovering_components':
-            print("💡 WHAT'S HAPPENING:")
-            print("   • Scanner is retrieving all components from repositories")
-            print("   • This can take time for large npm repositories (10-30 minutes)")
-            print("   • Individual reports will be created during asset scanning phase")
-        elif progress['phase'] == 'scanning_assets':
-            print("💡 WHAT'S HAPPENING:")
-            print("   • Scanner is downloading and scanning individual assets")
-            print("   • Individual HTML reports are being generated and organized")
-            print("   • Reports separated into 'with_vulnerabilities' and 'empty_reports' folders")
+        tips = PHASE_TIPS.get(progress['phase'])
+        if tips:
+            lines.append(tips)
         
     else:
-        print("❌ Could not parse progress from log file")
+        lines.append("❌ Could not parse progress from log file")
     
-    print()
-    print("Press Ctrl+C to exit monitor")
+    lines.append("")
+    lines.append("Press Ctrl+C to exit monitor")
+    
+    sys.stdout.write(CLEAR_SCREEN + "\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 def monitor_progress():
     """Main monitoring loop."""
@@ -218,13 +280,30 @@ def monitor_progress():
     print(f"📋 Monitoring: {log_file}")
     print("Starting progress monitor...\n")
     
+    if os.name == 'nt':
+        # An empty command makes the Windows console enable ANSI escape processing
+        os.system('')
+    
     start_time = os.path.getctime(log_file)
+    started = format_start_time(start_time)
+    
+    poll_interval = MIN_POLL_INTERVAL
+    last_offset = None
     
     try:
         while True:
             progress = parse_log_progress(log_file)
-            display_progress(progress, start_time)
-            time.sleep(10)  # Update every 10 seconds
+            display_progress(progress, start_time, started)
+            
+            # parse_log_progress records how far it has read, which tells whether the log grew
+            state = _log_state.get(log_file)
+            offset = state['offset'] if state else None
+            if offset != last_offset:
+                poll_interval = MIN_POLL_INTERVAL
+            else:
+                poll_interval = min(poll_interval * 2, MAX_POLL_INTERVAL)
+            last_offset = offset
+            time.sleep(poll_interval)
             
     except KeyboardInterrupt:
         print("\n\n👋 Progress monitor stopped.")
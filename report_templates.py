@@ -0,0 +1,618 @@
+#!/usr/bin/env python3
+"""
+HTML report templates for Nexus Vulnerability Scanner
+Static page skeletons are built once at import time instead of on every report
+"""
+
+from operator import itemgetter
+from string import Template
+
+# Stylesheets are written once into the output directory and linked from every report.
+# Reports are moved into scan_reports_<timestamp>/ subfolders, hence the ../ in the links.
+SCAN_REPORT_CSS = """
+body {
+    font-family: Arial, sans-serif;
+    margin: 20px;
+    background-color: #f5f5f5;
+}
+.container {
+    max-width: 1200px;
+    margin: 0 auto;
+    background-color: white;
+    padding: 20px;
+    border-radius: 8px;
+    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+}
+.header {
+    background-color: #2c3e50;
+    color: white;
+    padding: 20px;
+    border-radius: 8px;
+    margin-bottom: 20px;
+}
+.summary {
+    background-color: #ecf0f1;
+    padding: 15px;
+    border-radius: 5px;
+    margin-bottom: 20px;
+}
+.repository {
+    border: 1px solid #bdc3c7;
+    border-radius: 5px;
+    margin-bottom: 20px;
+    overflow: hidden;
+}
+.repo-header {
+    background-color: #3498db;
+    color: white;
+    padding: 15px;
+    font-weight: bold;
+    font-size: 18px;
+}
+.component {
+    border-bottom: 1px solid #ecf0f1;
+    padding: 10px;
+}
+.component-name {
+    font-weight: bold;
+    color: #2c3e50;
+    margin-bottom: 10px;
+}
+.vulnerability {
+    background-color: #fff;
+    border-left: 4px solid #e74c3c;
+    padding: 10px;
+    margin: 5px 0;
+}
+.vulnerability.HIGH {
+    border-left-color: #e74c3c;
+}
+.vulnerability.MEDIUM {
+    border-left-color: #f39c12;
+}
+.vulnerability.LOW {
+    border-left-color: #f1c40f;
+}
+.vulnerability.CRITICAL {
+    border-left-color: #8e44ad;
+}
+.vuln-id {
+    font-weight: bold;
+    color: #e74c3c;
+}
+.severity {
+    display: inline-block;
+    padding: 2px 8px;
+    border-radius: 3px;
+    color: white;
+    font-size: 12px;
+    font-weight: bold;
+}
+.severity.CRITICAL {
+    background-color: #8e44ad;
+}
+.severity.HIGH {
+    background-color: #e74c3c;
+}
+.severity.MEDIUM {
+    background-color: #f39c12;
+}
+.severity.LOW {
+    background-color: #f1c40f;
+    color: #333;
+}
+.severity.UNKNOWN {
+    background-color: #95a5a6;
+}
+.no-vulnerabilities {
+    background-color: #d5f4e6;
+    color: #27ae60;
+    padding: 20px;
+    border-radius: 5px;
+    text-align: center;
+    margin: 20px 0;
+}
+.stats {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+    gap: 15px;
+    margin: 20px 0;
+}
+.stat-box {
+    background-color: #f8f9fa;
+    padding: 15px;
+    border-radius: 5px;
+    text-align: center;
+    border: 1px solid #dee2e6;
+}
+.stat-number {
+    font-size: 24px;
+    font-weight: bold;
+    color: #2c3e50;
+}
+.stat-label {
+    color: #6c757d;
+    font-size: 14px;
+}
+"""
+
+COMPREHENSIVE_REPORT_CSS = """
+body {
+    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    margin: 0;
+    padding: 20px;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    min-height: 100vh;
+}
+.container {
+    max-width: 1400px;
+    margin: 0 auto;
+    background-color: white;
+    border-radius: 15px;
+    box-shadow: 0 20px 40px rgba(0,0,0,0.1);
+    overflow: hidden;
+}
+.header {
+    background: linear-gradient(135deg, #2c3e50 0%, #34495e 100%);
+    color: white;
+    padding: 30px;
+    text-align: center;
+}
+.header h1 {
+    margin: 0 0 10px 0;
+    font-size: 2.5em;
+}
+.dashboard {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+    gap: 20px;
+    padding: 30px;
+    background-color: #f8f9fa;
+}
+.metric-card {
+    background: white;
+    border-radius: 10px;
+    padding: 25px;
+    text-align: center;
+    box-shadow: 0 5px 15px rgba(0,0,0,0.08);
+    transition: transform 0.3s ease;
+}
+.metric-card:hover {
+    transform: translateY(-5px);
+}
+.metric-number {
+    font-size: 3em;
+    font-weight: bold;
+    margin-bottom: 10px;
+}
+.metric-label {
+    color: #6c757d;
+    font-size: 1.1em;
+}
+.severity-chart {
+    padding: 30px;
+}
+.severity-bar {
+    margin: 10px 0;
+}
+.severity-bar-fill {
+    height: 30px;
+    border-radius: 15px;
+    display: flex;
+    align-items: center;
+    padding: 0 15px;
+    color: white;
+    font-weight: bold;
+}
+.critical { background-color: #8e44ad; }
+.high { background-color: #e74c3c; }
+.medium { background-color: #f39c12; }
+.low { background-color: #f1c40f; color: #333; }
+.unknown { background-color: #95a5a6; }
+
+/* Enhanced Severity Section Styles */
+.severity-overview {
+    background: white;
+    border-radius: 10px;
+    padding: 25px;
+    margin: 20px 0;
+    box-shadow: 0 5px 15px rgba(0,0,0,0.08);
+}
+.severity-item {
+    margin-bottom: 20px;
+    padding: 15px;
+    background-color: #f8f9fa;
+    border-radius: 8px;
+}
+.severity-header {
+    display: flex;
+    align-items: center;
+    margin-bottom: 10px;
+    font-weight: bold;
+}
+.severity-icon {
+    font-size: 1.5em;
+    margin-right: 10px;
+}
+.severity-name {
+    flex: 1;
+    font-size: 1.2em;
+}
+.severity-count {
+    font-size: 1.5em;
+    color: #2c3e50;
+    margin-right: 10px;
+}
+.severity-percentage {
+    color: #6c757d;
+    font-size: 1em;
+}
+.severity-bar {
+    height: 20px;
+    background-color: #e9ecef;
+    border-radius: 10px;
+    overflow: hidden;
+    margin: 10px 0;
+}
+.severity-bar-fill {
+    height: 100%;
+    border-radius: 10px;
+    transition: width 0.3s ease;
+}
+.severity-description {
+    color: #6c757d;
+    font-size: 0.9em;
+    font-style: italic;
+    margin-top: 5px;
+}
+.vulnerability-summary {
+    background: white;
+    border-radius: 10px;
+    padding: 25px;
+    margin: 20px 0;
+    box-shadow: 0 5px 15px rgba(0,0,0,0.08);
+}
+.summary-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+    gap: 20px;
+    margin-top: 15px;
+}
+.summary-item {
+    text-align: center;
+    padding: 20px;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    border-radius: 10px;
+    box-shadow: 0 5px 15px rgba(0,0,0,0.1);
+}
+.summary-number {
+    font-size: 2.5em;
+    font-weight: bold;
+    margin-bottom: 5px;
+}
+.summary-label {
+    font-size: 0.9em;
+    opacity: 0.9;
+}
+
+.repo-section {
+    padding: 20px 30px;
+}
+.repo-card {
+    background: white;
+    border: 1px solid #dee2e6;
+    border-radius: 10px;
+    margin: 15px 0;
+    overflow: hidden;
+}
+.repo-header {
+    background-color: #007bff;
+    color: white;
+    padding: 20px;
+    font-size: 1.2em;
+    font-weight: bold;
+}
+.repo-content {
+    padding: 20px;
+}
+.vulnerability-list {
+    margin-top: 20px;
+}
+.vuln-item {
+    background-color: #f8f9fa;
+    border-left: 4px solid #e74c3c;
+    padding: 15px;
+    margin: 10px 0;
+    border-radius: 0 5px 5px 0;
+}
+"""
+
+REPORT_STYLESHEETS = {
+    'scan_report.css': SCAN_REPORT_CSS,
+    'comprehensive_report.css': COMPREHENSIVE_REPORT_CSS
+}
+
+# Consolidated scan report (nexus_scan_report_*.html)
+SCAN_REPORT_HEADER = Template("""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Nexus Vulnerability Scan Report</title>
+    <link rel="stylesheet" href="../scan_report.css">
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>Nexus Repository Vulnerability Scan Report</h1>
+            <p>Generated on: $timestamp</p>
+            <p>Nexus Server: $nexus_url</p>
+        </div>
+        
+        <div class="summary">
+            <h2>Scan Summary</h2>
+            <div class="stats">
+                <div class="stat-box">
+                    <div class="stat-number">$repositories_scanned</div>
+                    <div class="stat-label">Repositories Scanned</div>
+                </div>
+                <div class="stat-box">
+                    <div class="stat-number">$components_found</div>
+                    <div class="stat-label">Components Found</div>
+                </div>
+                <div class="stat-box">
+                    <div class="stat-number">$assets_scanned</div>
+                    <div class="stat-label">Assets Scanned</div>
+                </div>
+                <div class="stat-box">
+                    <div class="stat-number">$vulnerabilities_found</div>
+                    <div class="stat-label">Vulnerabilities Found</div>
+                </div>
+            </div>
+        </div>
+""")
+
+SCAN_REPORT_NO_VULNERABILITIES = """
+        <div class="no-vulnerabilities">
+            <h2>No Vulnerabilities Found</h2>
+            <p>Great news! No security vulnerabilities were detected in any of the scanned repositories.</p>
+        </div>
+"""
+
+# Group headings, filled with the escaped repository / component name
+SCAN_REPORT_REPOSITORY_HEADER = """
+        <div class="repository">
+            <div class="repo-header">Repository: {}</div>
+"""
+
+SCAN_REPORT_COMPONENT_HEADER = """
+            <div class="component">
+                <div class="component-name">Component: {}</div>
+"""
+
+# One vulnerability entry, filled with str.format_map from the escaped record over these defaults
+SCAN_REPORT_VULNERABILITY = """
+                <div class="vulnerability {severity_class}">
+                    <div class="vuln-id">{vulnerability_id}</div>
+                    <span class="severity {severity_class}">{severity}</span>
+                    <h4>{title}</h4>
+                    <p><strong>Package:</strong> {pkg_name} ({pkg_version})</p>
+                    <p><strong>Description:</strong> {description}</p>
+                    <p><strong>Fixed Version:</strong> {fixed_version}</p>
+                    <p><strong>Asset:</strong> {asset}</p>
+                </div>
+"""
+
+# The same finding reported for several assets of a component is rendered once, with the assets collapsed
+SCAN_REPORT_REPEATED_VULNERABILITY = """
+                <div class="vulnerability {severity_class}">
+                    <div class="vuln-id">{vulnerability_id} &mdash; {occurrences} occurrences</div>
+                    <span class="severity {severity_class}">{severity}</span>
+                    <h4>{title}</h4>
+                    <p><strong>Package:</strong> {pkg_name} ({pkg_version})</p>
+                    <p><strong>Description:</strong> {description}</p>
+                    <p><strong>Fixed Version:</strong> {fixed_version}</p>
+                    <details>
+                        <summary>Affected assets ({asset_count})</summary>
+                        <ul>
+{asset_items}
+                        </ul>
+                    </details>
+                </div>
+"""
+
+SCAN_REPORT_ASSET_ITEM = "                            <li>{}</li>"
+
+SCAN_REPORT_VULNERABILITY_DEFAULTS = {
+    'severity': 'UNKNOWN',
+    'vulnerability_id': 'N/A',
+    'title': 'No title available',
+    'pkg_name': 'N/A',
+    'pkg_version': 'N/A',
+    'description': 'No description available',
+    'fixed_version': 'Not available',
+    'asset': 'N/A'
+}
+
+# Severities with a stylesheet rule; anything else is styled as UNKNOWN
+SCAN_REPORT_SEVERITY_CLASSES = {severity: severity for severity in ('CRITICAL', 'HIGH', 'MEDIUM', 'LOW', 'UNKNOWN')}
+
+# Comprehensive report (comprehensive_scan_report_*.html)
+COMPREHENSIVE_REPORT_HEADER = Template("""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Comprehensive Nexus Security Report</title>
+    <link rel="stylesheet" href="../comprehensive_report.css">
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>Comprehensive Security Analysis Report</h1>
+            <p>Nexus Repository Vulnerability Assessment</p>
+            <p>Generated: $timestamp | Server: $nexus_url</p>
+        </div>
+        
+        <div class="dashboard">
+            <div class="metric-card">
+                <div class="metric-number" style="color: #007bff;">$repositories_scanned</div>
+                <div class="metric-label">Repositories</div>
+            </div>
+            <div class="metric-card">
+                <div class="metric-number" style="color: #28a745;">$components_found</div>
+                <div class="metric-label">Components</div>
+            </div>
+            <div class="metric-card">
+                <div class="metric-number" style="color: #17a2b8;">$assets_scanned</div>
+                <div class="metric-label">Assets Scanned</div>
+            </div>
+            <div class="metric-card">
+                <div class="metric-number" style="color: #dc3545;">$vulnerabilities_found</div>
+                <div class="metric-label">Vulnerabilities</div>
+            </div>
+        </div>
+""")
+
+COMPREHENSIVE_DETAILS_TABLE_HEADER = """
+        <div class="vulnerability-details-section">
+            <h2>🔍 Vulnerability Details</h2>
+            <div class="table-container" style="overflow-x: auto; margin: 20px 0; border: 1px solid #ddd; border-radius: 8px;">
+                <table style="width: 100%; border-collapse: collapse; background: white;">
+                    <thead style="background: #f8f9fa; border-bottom: 2px solid #dee2e6;">
+                        <tr>
+                            <th style="padding: 12px; text-align: left; font-weight: 600; color: #495057;">Component</th>
+                            <th style="padding: 12px; text-align: left; font-weight: 600; color: #495057;">Package</th>
+                            <th style="padding: 12px; text-align: left; font-weight: 600; color: #495057;">Vulnerability ID</th>
+                            <th style="padding: 12px; text-align: left; font-weight: 600; color: #495057;">Severity</th>
+                            <th style="padding: 12px; text-align: left; font-weight: 600; color: #495057;">Installed Version</th>
+                            <th style="padding: 12px; text-align: left; font-weight: 600; color: #495057;">Fixed Version</th>
+                            <th style="padding: 12px; text-align: left; font-weight: 600; color: #495057;">Repository</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+"""
+
+# One row of the vulnerability details table, filled like SCAN_REPORT_VULNERABILITY
+COMPREHENSIVE_VULNERABILITY_ROW = """
+                        <tr style="border-bottom: 1px solid #dee2e6; background: {row_background};">
+                            <td style="padding: 10px; font-family: monospace; font-size: 0.9em;">{component}</td>
+                            <td style="padding: 10px; font-family: monospace; font-size: 0.9em;">{pkg_name}</td>
+                            <td style="padding: 10px;">
+                                <span style="font-family: monospace; color: #0066cc; font-weight: 500;">{vulnerability_id}</span>
+                            </td>
+                            <td style="padding: 10px;">
+                                <span style="background: {severity_color}; color: white; padding: 4px 8px; border-radius: 4px; font-size: 0.8em; font-weight: 600;">{severity}</span>
+                            </td>
+                            <td style="padding: 10px; font-family: monospace; color: #dc3545;">{pkg_version}</td>
+                            <td style="padding: 10px; font-family: monospace; color: #28a745;">{fixed_version}</td>
+                            <td style="padding: 10px; font-size: 0.9em;">{repository}</td>
+                        </tr>
+"""
+
+COMPREHENSIVE_VULNERABILITY_ROW_DEFAULTS = {
+    'severity': 'UNKNOWN',
+    'component': 'Unknown',
+    'pkg_name': 'N/A',
+    'vulnerability_id': 'N/A',
+    'pkg_version': 'N/A',
+    'fixed_version': 'N/A',
+    'repository': 'Unknown'
+}
+
+# Row values in a fixed order with one C-level lookup per record
+COMPREHENSIVE_VULNERABILITY_ROW_FIELDS = itemgetter(*COMPREHENSIVE_VULNERABILITY_ROW_DEFAULTS)
+
+# Severity analysis chart: severities in display order, with colour, icon, description and CSS class for each
+SEVERITY_CHART_ORDER = ('CRITICAL', 'HIGH', 'MEDIUM', 'LOW', 'UNKNOWN')
+SEVERITY_CHART_INFO = {
+    'CRITICAL': {'color': '#8e44ad', 'icon': '🔴', 'description': 'Critical vulnerabilities requiring immediate action'},
+    'HIGH': {'color': '#e74c3c', 'icon': '🟠', 'description': 'High severity vulnerabilities requiring urgent attention'},
+    'MEDIUM': {'color': '#f39c12', 'icon': '🟡', 'description': 'Medium severity vulnerabilities requiring timely resolution'},
+    'LOW': {'color': '#f1c40f', 'icon': '🟢', 'description': 'Low severity vulnerabilities for routine maintenance'},
+    'UNKNOWN': {'color': '#95a5a6', 'icon': '⚪', 'description': 'Unknown severity vulnerabilities requiring assessment'}
+}
+SEVERITY_CSS_CLASSES = {severity: severity.lower() for severity in SEVERITY_CHART_ORDER}
+
+# One bar of the severity analysis chart, filled from SEVERITY_CHART_INFO plus the counts
+COMPREHENSIVE_SEVERITY_ITEM = """
+                <div class="severity-item">
+                    <div class="severity-header">
+                        <span class="severity-icon">{icon}</span>
+                        <span class="severity-name">{severity}</span>
+                        <span class="severity-count">{count:,}</span>
+                        <span class="severity-percentage">({percentage_label}%)</span>
+                    </div>
+                    <div class="severity-bar">
+                        <div class="severity-bar-fill {css_class}" style="width: {percentage}%; background-color: {color};">
+                        </div>
+                    </div>
+                    <div class="severity-description">{description}</div>
+                </div>
+"""
+
+# Severity badge colours; anything unrecognised renders grey
+SEVERITY_BADGE_COLORS = {
+    'CRITICAL': '#d73527',
+    'HIGH': '#fd7e14',
+    'MEDIUM': '#ffc107',
+    'LOW': '#28a745',
+    'UNKNOWN': '#6c757d'
+}
+
+# Only critical and high rows are highlighted; everything else stays white
+SEVERITY_ROW_BACKGROUNDS = {
+    'CRITICAL': 'rgba(215, 53, 39, 0.1)',
+    'HIGH': 'rgba(253, 126, 20, 0.1)'
+}
+
+COMPREHENSIVE_DETAILS_TABLE_FOOTER = """
+                    </tbody>
+                </table>
+            </div>
+            <div style="margin: 10px 0; color: #666; font-size: 0.9em;">
+                <p><strong>📋 Legend:</strong> Critical and High severity vulnerabilities are highlighted with colored backgrounds. Vulnerability details are sorted by severity.</p>
+            </div>
+        </div>
+"""
+
+# Repository analysis card, filled from a repository_summary entry plus the escaped repository name
+COMPREHENSIVE_REPOSITORY_CARD_HEADER = """
+            <div class="repo-card">
+                <div class="repo-header">{repo_name}</div>
+                <div class="repo-content">
+                    <p><strong>Total Vulnerabilities:</strong> {total_vulnerabilities}</p>
+                    <p><strong>Affected Components:</strong> {unique_components_with_vulns}</p>
+                    <div class="vulnerability-list">
+                        <h4>Components with vulnerabilities:</h4>
+                        <ul>
+"""
+
+COMPREHENSIVE_COMPONENT_ITEM = "                            <li>{}</li>"
+
+COMPREHENSIVE_REPOSITORY_CARD_FOOTER = """
+                        </ul>
+                    </div>
+                </div>
+            </div>
+"""
+
+COMPREHENSIVE_CLEAN_STATUS = """
+        <div style="padding: 40px; text-align: center; background-color: #d4edda; color: #155724; margin: 20px;">
+            <h2>🎉 Security Status: CLEAN</h2>
+            <p>No security vulnerabilities were detected in any scanned repositories!</p>
+        </div>
+"""
+
+REPORT_FOOTER = """
+    </div>
+</body>
+</html>
+"""
+
+# Complete report bodies for scans without findings, so healthy runs skip aggregation and rendering
+SCAN_REPORT_EMPTY_BODY = SCAN_REPORT_NO_VULNERABILITIES + REPORT_FOOTER
+COMPREHENSIVE_EMPTY_BODY = COMPREHENSIVE_CLEAN_STATUS + REPORT_FOOTER
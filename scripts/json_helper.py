@@ -8,36 +8,88 @@ to replace jq dependency in bash scripts.
 import json
 import sys
 import os
+import functools
+import mmap
 from pathlib import Path
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson  # Optional faster JSON parser/encoder; the standard json module is used without it
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # Optional incremental parser; scan results are then counted without loading the whole document
+except ImportError:
+    ijson = None
+
+# Placeholder integrity hash written for every generated lock file entry
+PLACEHOLDER_INTEGRITY = "sha512-" + "0" * 64
+
+# Minimal node_modules/<dependency>/package.json, laid out as encode_json would write it
+DEPENDENCY_PACKAGE_JSON = '{{\n  "name": {},\n  "version": {}\n}}'
+
+# os.open flags for writing generated files; O_BINARY stops Windows from translating newlines
+WRITE_FILE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+# Interned Trivy severity names; counting through these turns the counter's key comparisons into identity checks
+SEVERITY_NAMES = {name: sys.intern(name) for name in ('CRITICAL', 'HIGH', 'MEDIUM', 'LOW', 'UNKNOWN')}
+
+def encode_json(data):
+    """Serialize data as 2-space indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+@functools.lru_cache(maxsize=32)
+def parse_json_file(json_file, mtime_ns, size):
+    """Parse a JSON file; mtime_ns and size are part of the cache key so an edited file is parsed again."""
+    with open(json_file, 'rb') as f:
+        content = f.read()
+    return orjson.loads(content) if orjson is not None else json.loads(content)
+
+def load_json_file(json_file):
+    """Load a JSON file through the parse cache, so a file read by several commands in one batch is parsed once."""
+    st = os.stat(json_file)
+    return parse_json_file(json_file, st.st_mtime_ns, st.st_size)
+
+@functools.lru_cache(maxsize=256)
+def split_field_path(field_path):
+    """Split a dotted field path such as .dependencies.lodash into its keys."""
+    return tuple(field_path.strip('.').split('.'))
 
 def read_json_field(json_file, field_path, default_value=""):
     """Read a specific field from a JSON file."""
     try:
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # Several fields of the same file are usually read in a row; parse it once while it is unchanged
+        data = load_json_file(json_file)
         
-        # Handle nested field paths like .dependencies
-        fields = field_path.strip('.').split('.')
+        # Handle nested field paths like .dependencies; a missing key and a null value both give the default
         current = data
-        
-        for field in fields:
-            if isinstance(current, dict) and field in current:
-                current = current[field]
-            else:
+        for field in split_field_path(field_path):
+            current = current.get(field) if isinstance(current, dict) else None
+            if current is None:
                 return default_value
         
-        if current is None:
-            return default_value
-            
         return current
     except (FileNotFoundError, json.JSONDecodeError, KeyError):
         return default_value
 
+def write_file_bytes(file_path, content):
+    """Write already-encoded content straight to a file descriptor, skipping the buffered file object."""
+    fd = os.open(file_path, WRITE_FILE_FLAGS, 0o644)
+    try:
+        view = memoryview(content)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
 def create_package_lock(package_json_file, output_dir):
     """Create a package-lock.json file based on package.json."""
     try:
-        with open(package_json_file, 'r', encoding='utf-8') as f:
-            package_data = json.load(f)
+        package_data = load_json_file(package_json_file)
         
         name = package_data.get('name', 'unknown')
         version = package_data.get('version', '0.0.0')
@@ -55,38 +107,31 @@ def create_package_lock(package_json_file, output_dir):
                     "version": version,
                     "license": "MIT"
                 }
-            },
-            "dependencies": {}
+            }
         }
         
         # Add dependencies if they exist
         if dependencies:
-            lock_data["packages"][""]["dependencies"] = dependencies
+            packages = lock_data["packages"]
+            packages[""]["dependencies"] = dependencies
             
             # Add node_modules entries
             for dep_name, dep_version in dependencies.items():
                 # Clean version (remove ^ ~ >= < etc)
                 clean_version = dep_version.lstrip('^~>=<')
+                resolved = f"https://registry.npmjs.org/{dep_name}/-/{dep_name}-{clean_version}.tgz"
                 
-                # Add to packages section
-                lock_data["packages"][f"node_modules/{dep_name}"] = {
+                # lockfileVersion 3 describes installed packages only here; the legacy "dependencies" section is not written
+                packages[f"node_modules/{dep_name}"] = {
                     "version": clean_version,
-                    "resolved": f"https://registry.npmjs.org/{dep_name}/-/{dep_name}-{clean_version}.tgz",
-                    "integrity": "sha512-" + "0" * 64,
+                    "resolved": resolved,
+                    "integrity": PLACEHOLDER_INTEGRITY,
                     "license": "MIT"
                 }
-                
-                # Add to dependencies section
-                lock_data["dependencies"][dep_name] = {
-                    "version": clean_version,
-                    "resolved": f"https://registry.npmjs.org/{dep_name}/-/{dep_name}-{clean_version}.tgz",
-                    "integrity": "sha512-" + "0" * 64
-                }
         
         # Write lock file
         lock_file_path = os.path.join(output_dir, 'package-lock.json')
-        with open(lock_file_path, 'w', encoding='utf-8') as f:
-            json.dump(lock_data, f, indent=2)
+        write_file_bytes(lock_file_path, encode_json(lock_data))
         
         return {
             'success': True,
@@ -102,11 +147,15 @@ def create_package_lock(package_json_file, output_dir):
             'error': str(e)
         }
 
+def write_dependency_package(dep_dir, content):
+    """Create one node_modules/<dependency> directory and its package.json."""
+    os.makedirs(dep_dir, exist_ok=True)
+    write_file_bytes(os.path.join(dep_dir, 'package.json'), content)
+
 def create_node_modules_structure(package_json_file, output_dir):
     """Create node_modules directory structure based on package.json."""
     try:
-        with open(package_json_file, 'r', encoding='utf-8') as f:
-            package_data = json.load(f)
+        package_data = load_json_file(package_json_file)
         
         dependencies = package_data.get('dependencies', {})
         
@@ -116,26 +165,19 @@ def create_node_modules_structure(package_json_file, output_dir):
         node_modules_dir = os.path.join(output_dir, 'node_modules')
         os.makedirs(node_modules_dir, exist_ok=True)
         
-        created_packages = 0
+        # Render every minimal package.json first, then create the directories and files concurrently
+        dep_dirs = []
+        contents = []
         for dep_name, dep_version in dependencies.items():
             # Clean version
             clean_version = dep_version.lstrip('^~>=<')
             
-            # Create dependency directory
-            dep_dir = os.path.join(node_modules_dir, dep_name)
-            os.makedirs(dep_dir, exist_ok=True)
-            
-            # Create minimal package.json for dependency
-            dep_package_json = {
-                "name": dep_name,
-                "version": clean_version
-            }
-            
-            dep_package_file = os.path.join(dep_dir, 'package.json')
-            with open(dep_package_file, 'w', encoding='utf-8') as f:
-                json.dump(dep_package_json, f, indent=2)
-            
-            created_packages += 1
+            dep_dirs.append(os.path.join(node_modules_dir, dep_name))
+            contents.append(DEPENDENCY_PACKAGE_JSON.format(json.dumps(dep_name), json.dumps(clean_version)).encode('utf-8'))
+        
+        with ThreadPoolExecutor(max_workers=min(32, len(dep_dirs))) as executor:
+            # Consuming the results re-raises the first failed write
+            created_packages = len(list(executor.map(write_dependency_package, dep_dirs, contents)))
         
         return {
             'success': True,
@@ -149,30 +191,69 @@ def create_node_modules_structure(package_json_file, output_dir):
             'error': str(e)
         }
 
+def count_severities_streamed(results_file):
+    """Count Trivy vulnerabilities per severity from parser events, without building the document."""
+    severity_counts = Counter()
+    severity = 'UNKNOWN'
+    
+    with open(results_file, 'rb') as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix == 'Results.item.Vulnerabilities.item':
+                if event == 'start_map':
+                    severity = 'UNKNOWN'
+                elif event == 'end_map':
+                    severity_counts[severity] += 1
+            elif prefix == 'Results.item.Vulnerabilities.item.Severity':
+                severity = SEVERITY_NAMES.get(value, value)
+    
+    return severity_counts
+
+def load_results_document(results_file):
+    """Parse a non-empty scan results file, letting orjson read it straight from a memory map instead of a copied buffer."""
+    with open(results_file, 'rb') as f:
+        if orjson is None:
+            return json.loads(f.read())
+        
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            # Results are parsed front to back once, so ask for aggressive readahead where supported
+            if hasattr(mapped, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            with memoryview(mapped) as view:
+                return orjson.loads(view)
+        finally:
+            mapped.close()
+
 def analyze_scan_results(results_file):
     """Analyze Trivy scan results JSON file."""
     try:
-        with open(results_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        total_vulns = 0
-        severity_counts = {}
-        
-        # Extract vulnerabilities from results
-        if isinstance(data, dict) and 'Results' in data:
-            for result in data['Results']:
-                if 'Vulnerabilities' in result:
-                    vulns = result['Vulnerabilities']
-                    total_vulns += len(vulns)
-                    
-                    for vuln in vulns:
-                        severity = vuln.get('Severity', 'UNKNOWN')
-                        severity_counts[severity] = severity_counts.get(severity, 0) + 1
+        # An interrupted scan leaves an empty results file; report it without opening or parsing it
+        if os.stat(results_file).st_size == 0:
+            return {
+                'success': False,
+                'error': f"Results file is empty: {results_file}"
+            }
+        
+        if ijson is not None:
+            severity_counts = count_severities_streamed(results_file)
+        else:
+            data = load_results_document(results_file)
+            
+            # Extract vulnerabilities from results; Trivy writes null for sections with no findings
+            results = data.get('Results') if isinstance(data, dict) else None
+            severity_counts = Counter(
+                SEVERITY_NAMES.get(severity, severity)
+                for severity in (
+                    vuln.get('Severity', 'UNKNOWN')
+                    for result in results or []
+                    for vuln in result.get('Vulnerabilities') or []
+                )
+            )
         
         return {
             'success': True,
-            'total_vulnerabilities': total_vulns,
-            'severity_breakdown': severity_counts
+            'total_vulnerabilities': sum(severity_counts.values()),
+            'severity_breakdown': dict(severity_counts)
         }
         
     except Exception as e:
@@ -181,66 +262,61 @@ def analyze_scan_results(results_file):
             'error': str(e)
         }
 
+# Command name -> (function, argument usage, required and maximum argument counts)
+COMMANDS = {
+    'read_field': (read_json_field, '<json_file> <field_path> [default_value]', 2, 3),
+    'create_lock': (create_package_lock, '<package_json_file> <output_dir>', 2, 2),
+    'create_modules': (create_node_modules_structure, '<package_json_file> <output_dir>', 2, 2),
+    'analyze_results': (analyze_scan_results, '<results_file>', 1, 1)
+}
+
+def format_result(result):
+    """Render a command result as its single output line."""
+    return json.dumps(result) if isinstance(result, (dict, list)) else str(result)
+
+def run_batch(lines):
+    """Run one command per input line, given as a JSON array such as ["read_field", "package.json", "name", "unknown"].
+    
+    Each command prints the same single line as its standalone invocation, so callers read the results in order.
+    """
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            command, *args = json.loads(line)
+            result = COMMANDS[command][0](*args)
+        except Exception as e:
+            result = {'success': False, 'error': f"Invalid batch command {line.strip()}: {e}"}
+        print(format_result(result))
+
 def main():
     """Main function to handle command line arguments."""
     if len(sys.argv) < 2:
         print("Usage: python3 json_helper.py <command> [args...]", file=sys.stderr)
         print("Commands:", file=sys.stderr)
-        print("  read_field <json_file> <field_path> [default_value]", file=sys.stderr)
-        print("  create_lock <package_json_file> <output_dir>", file=sys.stderr)
-        print("  create_modules <package_json_file> <output_dir>", file=sys.stderr)
-        print("  analyze_results <results_file>", file=sys.stderr)
+        for command, (_, usage, _, _) in COMMANDS.items():
+            print(f"  {command} {usage}", file=sys.stderr)
+        print("  batch  (reads one JSON command array per line from stdin)", file=sys.stderr)
         sys.exit(1)
     
     command = sys.argv[1]
     
-    if command == "read_field":
-        if len(sys.argv) < 4:
-            print("Usage: read_field <json_file> <field_path> [default_value]", file=sys.stderr)
-            sys.exit(1)
-        
-        json_file = sys.argv[2]
-        field_path = sys.argv[3]
-        default_value = sys.argv[4] if len(sys.argv) > 4 else ""
-        
-        result = read_json_field(json_file, field_path, default_value)
-        print(json.dumps(result) if isinstance(result, (dict, list)) else str(result))
+    if command == "batch":
+        run_batch(sys.stdin)
+        return
     
-    elif command == "create_lock":
-        if len(sys.argv) < 4:
-            print("Usage: create_lock <package_json_file> <output_dir>", file=sys.stderr)
-            sys.exit(1)
-        
-        package_json_file = sys.argv[2]
-        output_dir = sys.argv[3]
-        
-        result = create_package_lock(package_json_file, output_dir)
-        print(json.dumps(result))
-    
-    elif command == "create_modules":
-        if len(sys.argv) < 4:
-            print("Usage: create_modules <package_json_file> <output_dir>", file=sys.stderr)
-            sys.exit(1)
-        
-        package_json_file = sys.argv[2]
-        output_dir = sys.argv[3]
-        
-        result = create_node_modules_structure(package_json_file, output_dir)
-        print(json.dumps(result))
-    
-    elif command == "analyze_results":
-        if len(sys.argv) < 3:
-            print("Usage: analyze_results <results_file>", file=sys.stderr)
-            sys.exit(1)
-        
-        results_file = sys.argv[2]
-        
-        result = analyze_scan_results(results_file)
-        print(json.dumps(result))
-    
-    else:
+    spec = COMMANDS.get(command)
+    if spec is None:
         print(f"Unknown command: {command}", file=sys.stderr)
         sys.exit(1)
+    
+    function, usage, required_args, max_args = spec
+    args = sys.argv[2:2 + max_args]
+    if len(args) < required_args:
+        print(f"Usage: {command} {usage}", file=sys.stderr)
+        sys.exit(1)
+    
+    print(format_result(function(*args)))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -201,9 +201,15 @@ enhance_nodejs_package() {
             return 0
         fi
         
-        local name version
-        name=$($python_cmd "$json_helper" read_field "$package_json_path" "name" "unknown")
-        version=$($python_cmd "$json_helper" read_field "$package_json_path" "version" "0.0.0")
+        # Read both fields with one interpreter start; the path is JSON-escaped for the batch command lines
+        local name version package_json_arg
+        package_json_arg=${package_json_path//\\/\\\\}
+        package_json_arg=${package_json_arg//\"/\\\"}
+        {
+            IFS= read -r name
+            IFS= read -r version
+        } < <(printf '["read_field", "%s", "name", "unknown"]\n["read_field", "%s", "version", "0.0.0"]\n' \
+                "$package_json_arg" "$package_json_arg" | $python_cmd "$json_helper" batch)
         
         print_info "Enhancing Node.js package: $name@$version"
         